@@ -1,11 +1,31 @@
-"""GUI components for the Polyomino Puzzle Solver application."""
+"""GUI components for the Polyomino Puzzle Solver application.
 
-from src.gui.board_tab import BoardTab
-from src.gui.board_widget import BoardWidget
-from src.gui.editor_window import EditorWindow
-from src.gui.piece_tab import PieceTab
-from src.gui.saved_puzzles_tab import SavedPuzzlesTab
-from src.gui.visualization_window import VisualizationWindow
+Components are imported on first access, so importing one module (e.g.
+``src.gui.editor_window`` at startup) does not load the others.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.gui.board_tab import BoardTab
+    from src.gui.board_widget import BoardWidget
+    from src.gui.editor_window import EditorWindow
+    from src.gui.piece_tab import PieceTab
+    from src.gui.saved_puzzles_tab import SavedPuzzlesTab
+    from src.gui.visualization_window import VisualizationWindow
+
+# Module defining each exported name
+_EXPORTS = {
+    "BoardTab": "src.gui.board_tab",
+    "BoardWidget": "src.gui.board_widget",
+    "EditorWindow": "src.gui.editor_window",
+    "PieceTab": "src.gui.piece_tab",
+    "SavedPuzzlesTab": "src.gui.saved_puzzles_tab",
+    "VisualizationWindow": "src.gui.visualization_window",
+}
 
 __all__ = [
     "BoardTab",
@@ -15,3 +35,12 @@ __all__ = [
     "SavedPuzzlesTab",
     "VisualizationWindow",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported component on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
@@ -6,13 +6,16 @@ the puzzle board dimensions and marking blocked cells.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 
-from PySide6.QtCore import QSize, Qt, Signal
-from PySide6.QtGui import QColor, QPainter, QPaintEvent, QPen, QResizeEvent
+from PySide6.QtCore import QLine, QRect, QSize, Qt, Signal, Slot
+from PySide6.QtGui import (QColor, QImage, QPainter, QPaintEvent, QPen,
+                           QResizeEvent)
 from PySide6.QtWidgets import (QGridLayout, QLabel, QSizePolicy, QSpinBox,
                                QWidget)
 
+from src.utils.bitgrid import cells_to_rows, iter_cells, resize_rows
+
 
 class BoardGridWidget(QWidget):
     """Grid widget for editing board cells.
@@ -23,11 +26,11 @@ class BoardGridWidget(QWidget):
     Attributes:
         width: Number of columns in the board
         height: Number of rows in the board
-        blocked_cells: Set of blocked cell positions (row, col)
+        blocked_cells: Frozenset of blocked cell positions (row, col)
     """
 
     # Signals
-    blocked_cells_changed = Signal(set)
+    blocked_cells_changed = Signal(frozenset)
 
     # Constants
     MIN_CELL_SIZE = 5
@@ -36,6 +39,8 @@ class BoardGridWidget(QWidget):
     BLOCKED_COLOR = QColor(80, 80, 80)  # Dark gray for blocked cells
     EMPTY_COLOR = QColor(245, 245, 245)  # Light gray for empty cells
     GRID_COLOR = QColor(180, 180, 180)  # Medium gray for grid lines
+    LABEL_COLOR = QColor(100, 100, 100)  # Dark gray for row/column labels
+    GRID_PEN = QPen(GRID_COLOR, 1)
 
     def __init__(self, parent: QWidget | None = None) -> None:
         """Initialize the board grid widget.
@@ -47,9 +52,12 @@ class BoardGridWidget(QWidget):
 
         self._width = 5
         self._height = 5
-        self._blocked_cells: set[tuple[int, int]] = set()
+        self._blocked_rows: list[int] = [0] * self._height  # One bitmask per row
+        self._blocked_view: frozenset[tuple[int, int]] | None = None  # Cached
+        self._has_unsent_changes = False  # Edits made during the current drag
         self._cell_size = self.DEFAULT_CELL_SIZE
         self._is_blocking = True  # True = add blocked, False = remove blocked
+        self._grid_lines: list[QLine] | None = None  # Cached, origin-relative
 
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -67,7 +75,14 @@ class BoardGridWidget(QWidget):
         Args:
             value: New width (1-50)
         """
-        self._width = max(1, min(50, value))
+        value = max(1, min(50, value))
+        if value == self._width:
+            return
+        self._width = value
+        self._set_blocked_rows(
+            resize_rows(self._blocked_rows, self._width, self._height)
+        )
+        self._grid_lines = None
         self.updateGeometry()
         self.update()
 
@@ -83,25 +98,49 @@ class BoardGridWidget(QWidget):
         Args:
             value: New height (1-50)
         """
-        self._height = max(1, min(50, value))
+        value = max(1, min(50, value))
+        if value == self._height:
+            return
+        self._height = value
+        self._set_blocked_rows(
+            resize_rows(self._blocked_rows, self._width, self._height)
+        )
+        self._grid_lines = None
         self.updateGeometry()
         self.update()
 
     @property
-    def blocked_cells(self) -> set[tuple[int, int]]:
-        """Get the set of blocked cell positions."""
-        return self._blocked_cells.copy()
+    def blocked_cells(self) -> frozenset[tuple[int, int]]:
+        """Get the blocked cell positions.
+
+        The same frozenset is returned until the blocked cells change.
+        """
+        if self._blocked_view is None:
+            self._blocked_view = frozenset(iter_cells(self._blocked_rows))
+        return self._blocked_view
 
     @blocked_cells.setter
-    def blocked_cells(self, cells: set[tuple[int, int]]) -> None:
+    def blocked_cells(self, cells: Iterable[tuple[int, int]]) -> None:
         """Set the blocked cells and update display.
 
         Args:
-            cells: Set of (row, col) positions to mark as blocked
+            cells: (row, col) positions to mark as blocked
         """
-        self._blocked_cells = cells.copy()
+        rows = cells_to_rows(cells, self._width, self._height)
+        if rows == self._blocked_rows:
+            return  # Keeps the cached frozenset and skips the repaint
+        self._set_blocked_rows(rows)
         self.update()
 
+    def _set_blocked_rows(self, rows: list[int]) -> None:
+        """Replace the blocked row bitmasks and drop the cached frozenset.
+
+        Args:
+            rows: New row bitmasks
+        """
+        self._blocked_rows = rows
+        self._blocked_view = None
+
     def set_dimensions(self, width: int, height: int) -> None:
         """Set board dimensions and clear blocked cells that are out of bounds.
 
@@ -109,17 +148,20 @@ class BoardGridWidget(QWidget):
             width: New width (1-50)
             height: New height (1-50)
         """
-        self._width = max(1, min(50, width))
-        self._height = max(1, min(50, height))
+        width = max(1, min(50, width))
+        height = max(1, min(50, height))
+        if (width, height) == (self._width, self._height):
+            return
+        self._width = width
+        self._height = height
 
         # Remove out-of-bounds blocked cells
-        self._blocked_cells = {
-            (r, c)
-            for r, c in self._blocked_cells
-            if 0 <= r < self._height and 0 <= c < self._width
-        }
+        self._set_blocked_rows(
+            resize_rows(self._blocked_rows, self._width, self._height)
+        )
 
         self._calculate_cell_size()
+        self._grid_lines = None
         self.updateGeometry()
         self.update()
 
@@ -138,9 +180,13 @@ class BoardGridWidget(QWidget):
         if self._width > 0 and self._height > 0:
             cell_width = available_width // self._width
             cell_height = available_height // self._height
-            self._cell_size = max(
+            cell_size = max(
                 self.MIN_CELL_SIZE, min(cell_width, cell_height, self.MAX_CELL_SIZE)
             )
+            # Most resizes keep the same cell size; keep the cached lines then
+            if cell_size != self._cell_size:
+                self._cell_size = cell_size
+                self._grid_lines = None
 
     def sizeHint(self) -> QSize:
         """Return the preferred size hint."""
@@ -157,48 +203,55 @@ class BoardGridWidget(QWidget):
     def paintEvent(self, event: QPaintEvent) -> None:
         """Paint the board grid."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Extra padding for labels
-        label_padding = 25
-        grid_width = self._width * self._cell_size
-        grid_height = self._height * self._cell_size
-        offset_x = (self.width() - grid_width) // 2
-        offset_y = (self.height() - grid_height) // 2
-
-        # Ensure labels have enough space
-        offset_x = max(offset_x, label_padding)
-        offset_y = max(offset_y, label_padding)
-
-        # Draw cells
-        for row in range(self._height):
-            for col in range(self._width):
-                x = offset_x + col * self._cell_size
-                y = offset_y + row * self._cell_size
-
-                # Determine cell color
-                if (row, col) in self._blocked_cells:
-                    color = self.BLOCKED_COLOR
-                else:
-                    color = self.EMPTY_COLOR
-
-                painter.fillRect(x, y, self._cell_size, self._cell_size, color)
-
-                # Draw grid lines
-                pen = QPen(self.GRID_COLOR)
-                pen.setWidth(1)
-                painter.setPen(pen)
-                painter.drawRect(x, y, self._cell_size, self._cell_size)
+        cell_size = self._cell_size
+        offset_x, offset_y = self._grid_origin()
+
+        # Only cells intersecting the dirty rect need repainting
+        dirty = event.rect()
+        col_start = max(0, (dirty.left() - offset_x) // cell_size)
+        col_end = min(self._width, (dirty.right() - offset_x) // cell_size + 1)
+        row_start = max(0, (dirty.top() - offset_y) // cell_size)
+        row_end = min(self._height, (dirty.bottom() - offset_y) // cell_size + 1)
+        visible_cols = col_end - col_start
+        visible_rows = row_end - row_start
+
+        # Draw cells as a single image blit: one pixel per cell, scaled up
+        if visible_cols > 0 and visible_rows > 0:
+            image = QImage(visible_cols, visible_rows, QImage.Format.Format_RGB32)
+            image.fill(self.EMPTY_COLOR)
+            col_mask = (1 << visible_cols) - 1
+            visible_masks = [
+                (mask >> col_start) & col_mask
+                for mask in self._blocked_rows[row_start:row_end]
+            ]
+            for row, col in iter_cells(visible_masks):
+                image.setPixelColor(col, row, self.BLOCKED_COLOR)
+            painter.drawImage(
+                QRect(
+                    offset_x + col_start * cell_size,
+                    offset_y + row_start * cell_size,
+                    visible_cols * cell_size,
+                    visible_rows * cell_size,
+                ),
+                image,
+            )
+
+        # Draw grid lines in one batched call
+        painter.setPen(self.GRID_PEN)
+        painter.translate(offset_x, offset_y)
+        painter.drawLines(self._get_grid_lines())
+        painter.translate(-offset_x, -offset_y)
 
         # Draw row/column labels if cells are large enough
         if self._cell_size >= 20:
             font = painter.font()
             font.setPointSize(max(7, min(10, self._cell_size // 3)))
             painter.setFont(font)
-            painter.setPen(QColor(100, 100, 100))
+            painter.setPen(self.LABEL_COLOR)
 
             # Column labels (top)
-            for col in range(self._width):
+            for col in range(col_start, col_end):
                 x = offset_x + col * self._cell_size + self._cell_size // 2
                 y = offset_y - 8
                 label = str(col)
@@ -207,7 +260,7 @@ class BoardGridWidget(QWidget):
                 painter.drawText(int(x - text_width // 2), int(y), label)
 
             # Row labels (left)
-            for row in range(self._height):
+            for row in range(row_start, row_end):
                 x = offset_x - 8
                 y = offset_y + row * self._cell_size + self._cell_size // 2
                 label = str(row)
@@ -219,6 +272,56 @@ class BoardGridWidget(QWidget):
                     label,
                 )
 
+    def _grid_origin(self) -> tuple[int, int]:
+        """Get the widget position of the grid's top-left corner.
+
+        Returns:
+            (x, y) offset that centers the grid, leaving room for labels
+        """
+        # Extra padding for labels
+        label_padding = 25
+        offset_x = (self.width() - self._width * self._cell_size) // 2
+        offset_y = (self.height() - self._height * self._cell_size) // 2
+        return max(offset_x, label_padding), max(offset_y, label_padding)
+
+    def _cell_rect(self, row: int, col: int) -> QRect:
+        """Get the widget area covered by a cell, including its border.
+
+        Args:
+            row: Cell row
+            col: Cell column
+
+        Returns:
+            QRect to pass to update() when only this cell changed
+        """
+        offset_x, offset_y = self._grid_origin()
+        return QRect(
+            offset_x + col * self._cell_size,
+            offset_y + row * self._cell_size,
+            self._cell_size,
+            self._cell_size,
+        ).adjusted(-1, -1, 1, 1)
+
+    def _get_grid_lines(self) -> list[QLine]:
+        """Get the grid lines relative to the grid's top-left corner.
+
+        The list is cached until the dimensions or cell size change.
+
+        Returns:
+            Vertical then horizontal lines bounding every cell
+        """
+        if self._grid_lines is None:
+            grid_width = self._width * self._cell_size
+            grid_height = self._height * self._cell_size
+            self._grid_lines = [
+                QLine(x, 0, x, grid_height)
+                for x in range(0, grid_width + 1, self._cell_size)
+            ] + [
+                QLine(0, y, grid_width, y)
+                for y in range(0, grid_height + 1, self._cell_size)
+            ]
+        return self._grid_lines
+
     def _get_cell_at_position(self, pos_x: int, pos_y: int) -> tuple[int, int] | None:
         """Get the cell coordinates at the given position.
 
@@ -229,17 +332,9 @@ class BoardGridWidget(QWidget):
         Returns:
             (row, col) tuple or None if position is outside the grid
         """
-        grid_width = self._width * self._cell_size
-        grid_height = self._height * self._cell_size
-        offset_x = (self.width() - grid_width) // 2
-        offset_y = (self.height() - grid_height) // 2
-
-        # Check if position is within grid bounds
-        if pos_x < offset_x or pos_x >= offset_x + grid_width:
-            return None
-        if pos_y < offset_y or pos_y >= offset_y + grid_height:
-            return None
-
+        # Use the same origin as paintEvent so clicks land on the drawn cell;
+        # positions left of or above the grid floor-divide to negative indices
+        offset_x, offset_y = self._grid_origin()
         col = (pos_x - offset_x) // self._cell_size
         row = (pos_y - offset_y) // self._cell_size
 
@@ -265,20 +360,35 @@ class BoardGridWidget(QWidget):
             self._is_blocking = False
             self._toggle_cell_at_position(event.pos())
 
+    def mouseReleaseEvent(self, event) -> None:
+        """Emit one blocked_cells_changed for the whole click or drag."""
+        if self._has_unsent_changes:
+            self._has_unsent_changes = False
+            self.blocked_cells_changed.emit(self.blocked_cells)
+        super().mouseReleaseEvent(event)
+
     def _toggle_cell_at_position(self, pos) -> None:
         """Toggle blocked state at the given position.
 
+        The change is emitted on mouse release, so a drag across many cells
+        produces a single blocked_cells_changed.
+
         Args:
             pos: QPoint position
         """
         cell = self._get_cell_at_position(pos.x(), pos.y())
-        if cell is not None:
-            if self._is_blocking:
-                self._blocked_cells.add(cell)
-            else:
-                self._blocked_cells.discard(cell)
-            self.blocked_cells_changed.emit(self._blocked_cells)
-            self.update()
+        if cell is None:
+            return
+
+        row, col = cell
+        bit = 1 << col
+        if bool(self._blocked_rows[row] & bit) == self._is_blocking:
+            return  # Already in the requested state, e.g. dragging within a cell
+
+        self._blocked_rows[row] ^= bit
+        self._blocked_view = None
+        self._has_unsent_changes = True
+        self.update(self._cell_rect(row, col))
 
 
 class BoardTab(QWidget):
@@ -294,14 +404,15 @@ class BoardTab(QWidget):
 
     # Signals
     dimensions_changed = Signal(int, int)
-    blocked_cells_changed = Signal(set)
+    blocked_cells_changed = Signal(frozenset)
 
     def __init__(
         self,
         parent: QWidget | None = None,
         *,
         on_dimensions_changed: Callable[[int, int], None] | None = None,
-        on_blocked_cells_changed: Callable[[set[tuple[int, int]]], None] | None = None,
+        on_blocked_cells_changed: Callable[[frozenset[tuple[int, int]]], None]
+        | None = None,
     ) -> None:
         """Initialize the board tab.
 
@@ -339,6 +450,8 @@ class BoardTab(QWidget):
         self._width_spinner.setRange(1, 50)
         self._width_spinner.setValue(5)
         self._width_spinner.setFixedWidth(80)
+        # Apply typed values on Enter/focus-out, not per keystroke
+        self._width_spinner.setKeyboardTracking(False)
         layout.addWidget(width_label, 1, 0)
         layout.addWidget(self._width_spinner, 1, 1)
 
@@ -348,6 +461,7 @@ class BoardTab(QWidget):
         self._height_spinner.setRange(1, 50)
         self._height_spinner.setValue(5)
         self._height_spinner.setFixedWidth(80)
+        self._height_spinner.setKeyboardTracking(False)
         layout.addWidget(height_label, 2, 0)
         layout.addWidget(self._height_spinner, 2, 1)
 
@@ -371,6 +485,7 @@ class BoardTab(QWidget):
         # Set row stretch for the grid area to expand
         layout.setRowStretch(4, 1)
 
+    @Slot()
     def _on_dimension_changed(self) -> None:
         """Handle dimension spinner changes."""
         width = self._width_spinner.value()
@@ -380,11 +495,12 @@ class BoardTab(QWidget):
         if self._dimensions_callback:
             self._dimensions_callback(width, height)
 
-    def _on_blocked_cells_changed(self, cells: set[tuple[int, int]]) -> None:
+    @Slot(frozenset)
+    def _on_blocked_cells_changed(self, cells: frozenset[tuple[int, int]]) -> None:
         """Handle blocked cells changes.
 
         Args:
-            cells: Set of blocked cell positions
+            cells: Blocked cell positions
         """
         self._status_label.setText(f"Blocked cells: {len(cells)}")
         self.blocked_cells_changed.emit(cells)
@@ -402,7 +518,7 @@ class BoardTab(QWidget):
         return self._height_spinner.value()
 
     @property
-    def blocked_cells(self) -> set[tuple[int, int]]:
+    def blocked_cells(self) -> frozenset[tuple[int, int]]:
         """Get the current blocked cells."""
         return self._grid_widget.blocked_cells
 
@@ -413,14 +529,26 @@ class BoardTab(QWidget):
             width: Board width (1-50)
             height: Board height (1-50)
         """
+        previous = (self.board_width, self.board_height)
+
+        # Set both spinners silently so a resize is applied and emitted once
+        self._width_spinner.blockSignals(True)
+        self._height_spinner.blockSignals(True)
         self._width_spinner.setValue(width)
         self._height_spinner.setValue(height)
+        self._width_spinner.blockSignals(False)
+        self._height_spinner.blockSignals(False)
+
+        if (self.board_width, self.board_height) != previous:
+            self._on_dimension_changed()
 
-    def set_blocked_cells(self, cells: set[tuple[int, int]]) -> None:
+    def set_blocked_cells(self, cells: Iterable[tuple[int, int]]) -> None:
         """Set blocked cells.
 
         Args:
-            cells: Set of (row, col) positions to mark as blocked
+            cells: (row, col) positions to mark as blocked
         """
         self._grid_widget.blocked_cells = cells
-        self._status_label.setText(f"Blocked cells: {len(cells)}")
+        self._status_label.setText(
+            f"Blocked cells: {len(self._grid_widget.blocked_cells)}"
+        )
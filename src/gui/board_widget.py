@@ -7,12 +7,17 @@ events. Does NOT contain timing or solver logic.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any, Optional
 
-from PySide6.QtCore import QRectF, Qt
-from PySide6.QtGui import QBrush, QColor, QPainter, QPen
+from PySide6.QtCore import QRectF, QSize, Qt
+from PySide6.QtGui import QBrush, QColor, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import QWidget
 
+# One color per hue degree, so piece colors are a table lookup rather than an
+# HSL conversion for every painted cell
+_PIECE_HUE_COLORS = tuple(QColor.fromHslF(hue / 360, 0.7, 0.6) for hue in range(360))
+
 
 class BoardWidget(QWidget):
     """Renders puzzle board state using QPainter.
@@ -21,6 +26,15 @@ class BoardWidget(QWidget):
     Does NOT contain timing or solver logic.
     """
 
+    # Constants
+    EMPTY_COLOR = QColor("#FFFFFF")  # White for empty cells
+    BLOCKED_COLOR = QColor("#333333")  # Dark gray for blocked cells
+    CELL_PEN = QPen(QColor("#888888"), 1)  # Cell border
+    TENTATIVE_COLOR = QColor(255, 0, 0, 128)  # Red with transparency
+    TENTATIVE_PEN = QPen(QColor("#FF0000"), 2)  # Tentative piece border
+    # Colors for the non-piece values a GameBoard cell can hold (-1 = blocked)
+    STATE_COLORS = {None: EMPTY_COLOR, -1: BLOCKED_COLOR}
+
     def __init__(
         self,
         width: int,
@@ -53,6 +67,10 @@ class BoardWidget(QWidget):
         self._current_position: Optional[tuple[int, int]] = (
             None  # current_position from event
         )
+        self._board_pixmap: Optional[QPixmap] = None  # Cached cells, None = stale
+        # Cells of each piece on the board, mirroring the solver's placed list
+        self._placed_cells: list[list[tuple[int, int]]] = []
+        self._cell_rects: Optional[list[list[QRectF]]] = None  # [row][col]
 
     def set_cell_size(self, cell_size: int) -> None:
         """Update the cell size and recalculate widget size.
@@ -60,65 +78,167 @@ class BoardWidget(QWidget):
         Args:
             cell_size: New pixel size for each cell
         """
+        if cell_size == self._cell_size:
+            return
+
         self._cell_size = cell_size
+        self._cell_rects = None
         self.setMinimumSize(
             self._width * cell_size + 2,
             self._height * cell_size + 2,
         )
+        self._board_pixmap = None
         self.updateGeometry()
         self.update()
 
     def handle_event(self, event: dict[str, Any]) -> None:
         """Update state based on solver event and trigger repaint.
 
+        Place and remove events only repaint the cells of the piece they
+        moved; any other event redraws the whole board on the next repaint.
+
         Args:
             event: Solver event dictionary with keys:
                 - board_snapshot: Current board state
                 - current_piece: Piece being attempted (optional)
                 - current_position: Position being tried (optional)
         """
-        self._board = event.get("board_snapshot")
+        board = event.get("board_snapshot")
+        changed_cells = self._track_placements(event, board is self._board)
+        self._board = board
         self._current_piece = event.get("current_piece")
         self._current_position = event.get("current_position")
+        if changed_cells is None:
+            self._board_pixmap = None
+        elif self._board_pixmap is not None:
+            painter = QPainter(self._board_pixmap)
+            self._draw_cells(painter, changed_cells)
+            painter.end()
         self.update()
 
+    def _track_placements(
+        self, event: dict[str, Any], same_board: bool
+    ) -> Optional[list[tuple[int, int]]]:
+        """Follow the solver's placed pieces from one event to the next.
+
+        Args:
+            event: Solver event dictionary
+            same_board: Whether the event is for the board already shown
+
+        Returns:
+            Cells changed since the previous event, or None if unknown
+        """
+        placed = event.get("placed_pieces") or []
+        placed_cells = self._placed_cells
+        if same_board:
+            event_type = event.get("type")
+            if event_type == "place" and len(placed) == len(placed_cells) + 1:
+                shape, (row_offset, col_offset) = placed[-1][:2]
+                cells = [(row_offset + row, col_offset + col) for row, col in shape]
+                placed_cells.append(cells)
+                return cells
+            if event_type == "remove" and len(placed) == len(placed_cells) - 1:
+                return placed_cells.pop()
+
+        self._placed_cells = [
+            [(row_offset + row, col_offset + col) for row, col in shape]
+            for shape, (row_offset, col_offset), *_ in placed
+        ]
+        return None
+
     def paintEvent(self, event) -> None:
         """Override to render board using QPainter."""
         if self._board is None:
             return
 
+        # Rebuild the cell pixmap at most once per repaint, however many
+        # events arrived since the last one
+        if self._board_pixmap is None:
+            self._board_pixmap = self._render_board()
+
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Draw each cell
-        for row in range(self._height):
-            for col in range(self._width):
-                rect = QRectF(
-                    col * self._cell_size + 1,
-                    row * self._cell_size + 1,
-                    self._cell_size - 2,
-                    self._cell_size - 2,
-                )
-
-                # Determine cell state
-                if self._board.is_blocked((row, col)):
-                    color = QColor("#333333")  # Blocked cells
-                else:
-                    piece_id = self._board.get_piece_at((row, col))
-                    if piece_id is not None:
-                        color = self._get_piece_color(piece_id)
-                    else:
-                        color = QColor("#FFFFFF")  # Empty cells
-
-                # Draw cell background
-                painter.fillRect(rect, color)
-                painter.setPen(QPen(QColor("#888888"), 1))
-                painter.drawRect(rect)
+        painter.drawPixmap(0, 0, self._board_pixmap)
 
         # Draw current piece being attempted (if any)
         if self._current_piece and self._current_position:
             self._draw_current_piece(painter)
 
+    def _render_board(self) -> QPixmap:
+        """Render all board cells into a pixmap.
+
+        Returns:
+            Pixmap covering the whole board, transparent between cells
+        """
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(
+            QSize(
+                self._width * self._cell_size + 2,
+                self._height * self._cell_size + 2,
+            )
+            * dpr
+        )
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        self._draw_cells(
+            painter,
+            ((row, col) for row in range(self._height) for col in range(self._width)),
+        )
+        painter.end()
+        return pixmap
+
+    def _draw_cells(
+        self, painter: QPainter, cells: Iterable[tuple[int, int]]
+    ) -> None:
+        """Draw board cells in their current state.
+
+        Cell colors are opaque, so redrawing a cell fully covers its old state.
+
+        Args:
+            painter: QPainter on the board pixmap
+            cells: (row, col) of the cells to draw
+        """
+        # Group cells by state (empty, blocked or a piece id) so each group is
+        # filled and outlined with a single drawRects call
+        cell_rects = self._get_cell_rects()
+        rects_by_state: dict[Optional[int], list[QRectF]] = {}
+        for row, col in cells:
+            piece_id = self._board.get_piece_at((row, col))
+            rects_by_state.setdefault(piece_id, []).append(cell_rects[row][col])
+
+        painter.setPen(self.CELL_PEN)
+        for piece_id, rects in rects_by_state.items():
+            color = self.STATE_COLORS.get(piece_id)
+            if color is None:
+                color = self._get_piece_color(piece_id)
+            painter.setBrush(color)
+            painter.drawRects(rects)
+
+    def _get_cell_rects(self) -> list[list[QRectF]]:
+        """Get the inset drawing rect of every cell, indexed [row][col].
+
+        The rects are cached until the cell size changes.
+
+        Returns:
+            Nested list of QRectF, one per cell
+        """
+        if self._cell_rects is None:
+            cell_size = self._cell_size
+            self._cell_rects = [
+                [
+                    QRectF(
+                        col * cell_size + 1,
+                        row * cell_size + 1,
+                        cell_size - 2,
+                        cell_size - 2,
+                    )
+                    for col in range(self._width)
+                ]
+                for row in range(self._height)
+            ]
+        return self._cell_rects
+
     def _get_piece_color(self, piece_id: int) -> QColor:
         """Get color for a piece based on its ID.
 
@@ -128,9 +248,7 @@ class BoardWidget(QWidget):
         Returns:
             QColor for this piece
         """
-        # Generate color from piece_id using HSL
-        hue = abs(piece_id) % 360
-        return QColor.fromHslF(hue / 360, 0.7, 0.6)
+        return _PIECE_HUE_COLORS[abs(piece_id) % 360]
 
     def _draw_current_piece(self, painter: QPainter) -> None:
         """Draw the current piece being attempted (with transparency).
@@ -142,22 +260,19 @@ class BoardWidget(QWidget):
             return
 
         row_offset, col_offset = self._current_position
-        shape = self._current_piece.canonical_shape
-
-        # Semi-transparent color for "tentative" piece
-        color = QColor(255, 0, 0, 128)  # Red with transparency
-
-        for cell_row, cell_col in shape:
-            row = row_offset + cell_row
-            col = col_offset + cell_col
-
-            if 0 <= row < self._height and 0 <= col < self._width:
-                rect = QRectF(
-                    col * self._cell_size + 1,
-                    row * self._cell_size + 1,
-                    self._cell_size - 2,
-                    self._cell_size - 2,
-                )
-                painter.fillRect(rect, color)
-                painter.setPen(QPen(QColor("#FF0000"), 2))
-                painter.drawRect(rect)
+        cell_rects = self._get_cell_rects()
+
+        # Offset and clip the shape in one pass, then draw the borders in a
+        # single batched call
+        rects = [
+            cell_rects[row][col]
+            for row, col in (
+                (row_offset + cell_row, col_offset + cell_col)
+                for cell_row, cell_col in self._current_piece.canonical_shape
+            )
+            if 0 <= row < self._height and 0 <= col < self._width
+        ]
+        for rect in rects:
+            painter.fillRect(rect, self.TENTATIVE_COLOR)
+        painter.setPen(self.TENTATIVE_PEN)
+        painter.drawRects(rects)
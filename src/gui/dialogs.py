@@ -0,0 +1,8 @@
+"""Shared constants for the puzzle editor's message boxes."""
+
+from __future__ import annotations
+
+from PySide6.QtWidgets import QMessageBox
+
+# Buttons for the yes/no confirmation prompts
+YES_NO = QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
@@ -6,25 +6,69 @@ defining puzzle pieces and board configurations.
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from functools import partial
 from pathlib import Path
-from typing import override
+from typing import TYPE_CHECKING, Any, override
 
-from PySide6.QtCore import QEvent, QSize
-from PySide6.QtGui import QAction
+from PySide6.QtCore import QEvent, QSize, Qt, QTimer, Slot
+from PySide6.QtGui import QAction, QShowEvent
 from PySide6.QtWidgets import (QFileDialog, QHBoxLayout, QLabel, QMainWindow,
-                               QMessageBox, QPushButton, QSizePolicy,
-                               QStatusBar, QTabWidget, QVBoxLayout, QWidget)
+                               QMessageBox, QProgressDialog, QPushButton,
+                               QSizePolicy, QStatusBar, QTabWidget,
+                               QVBoxLayout, QWidget)
+from shiboken6 import isValid
 
 from src.gui.board_tab import BoardTab
+from src.gui.dialogs import YES_NO
+from src.gui.io_task import start_io_task
 from src.gui.piece_tab import PieceTab
 from src.gui.saved_puzzles_tab import SavedPuzzlesTab
-from src.gui.visualization_window import VisualizationWindow
 from src.models.piece import PuzzlePiece
 from src.models.puzzle_config import PuzzleConfiguration
 from src.utils.file_io import (export_puzzle, import_puzzle, load_puzzle,
                                save_puzzle)
+from src.utils.paths import SAVED_PUZZLES_DIR
 
-SAVED_PUZZLES_DIR = Path.home() / ".polyomino-puzzles" / "saved"
+if TYPE_CHECKING:
+    from src.gui.visualization_window import VisualizationWindow
+
+# Validation label style sheets, one per status
+_STYLE_EMPTY = "color: orange;"
+_STYLE_OVER = "color: red;"
+_STYLE_UNDER = "color: blue;"
+_STYLE_VALID = "color: green;"
+
+
+def _validation_status(
+    is_empty: bool, piece_area: int, board_area: int
+) -> tuple[str, str]:
+    """Get the validation label text and style sheet for a configuration.
+
+    Args:
+        is_empty: Whether the configuration has no pieces
+        piece_area: Total area of all pieces
+        board_area: Number of cells available for pieces
+
+    Returns:
+        (text, style sheet) for the validation label
+    """
+    if is_empty:
+        return "No pieces defined", _STYLE_EMPTY
+    if piece_area > board_area:
+        return (
+            f"Warning: Piece area ({piece_area}) exceeds "
+            f"available board area ({board_area})",
+            _STYLE_OVER,
+        )
+    if piece_area < board_area:
+        return (
+            f"Note: Piece area ({piece_area}) is less than "
+            f"board area ({board_area})",
+            _STYLE_UNDER,
+        )
+    return "Configuration valid", _STYLE_VALID
 
 
 class EditorWindow(QMainWindow):
@@ -42,19 +86,38 @@ class EditorWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("Polyomino Puzzle Solver")
         self.setMinimumSize(QSize(800, 600))
-        self._config = PuzzleConfiguration(
+        self._config = self._create_default_config()
+        self._selected_piece_index: int | None = None
+        self._menu_built = False  # Menu bar is built on first show
+        self._info_box: QMessageBox | None = None  # Shared by _show_info()
+        # Export/import dialogs reopen where the user last picked a file
+        self._last_export_dir = Path.home()
+        # File dialogs by title, created on first use by _choose_file()
+        self._file_dialogs: dict[str, QFileDialog] = {}
+        # Tabs ("board", "pieces") to refresh once they are next shown
+        self._pending_updates: set[str] = set()
+        # Solver windows opened from this editor. Each is deleted when closed;
+        # entries for deleted windows are pruned whenever a new one opens
+        self._viz_windows: list[VisualizationWindow] = []
+
+        self._setup_ui()
+        self._setup_status_bar()
+
+        # Listing saved puzzles reads the disk; do it once the event loop runs
+        # so the window can be shown first. The tab is the timer's context, so
+        # the call is dropped if the editor is deleted before then
+        QTimer.singleShot(0, self._saved_puzzles_tab, self._saved_puzzles_tab.refresh)
+
+    @staticmethod
+    def _create_default_config() -> PuzzleConfiguration:
+        """Create the empty 5×5 configuration used for a new puzzle."""
+        return PuzzleConfiguration(
             name="New Puzzle",
             board_width=5,
             board_height=5,
             pieces={},
             blocked_cells=set(),
         )
-        self._selected_piece_index: int | None = None
-
-        self._setup_ui()
-        self._setup_menu()
-        self._setup_status_bar()
-        self._saved_puzzles_tab.refresh()
 
     def _setup_ui(self) -> None:
         """Set up the user interface."""
@@ -89,10 +152,10 @@ class EditorWindow(QMainWindow):
         self._tab_widget.addTab(self._piece_tab, "Pieces")
         self._tab_widget.addTab(self._board_tab, "Board")
         self._tab_widget.addTab(self._saved_puzzles_tab, "Saved Puzzles")
+        self._tab_widget.currentChanged.connect(self._flush_updates)
 
-        # Bottom button bar
-        button_container = QWidget()
-        button_layout = QHBoxLayout(button_container)
+        # Bottom button bar, nested directly in the main layout
+        button_layout = QHBoxLayout()
         button_layout.setContentsMargins(10, 5, 10, 10)
 
         # Spacer
@@ -107,69 +170,59 @@ class EditorWindow(QMainWindow):
 
         # Validation status label
         self._validation_label = QLabel("")
-        self._validation_label.setStyleSheet("color: orange;")
+        self._validation_label.setStyleSheet(_STYLE_EMPTY)
+        # (is_empty, piece_area, board_area) the label was last built from
+        self._validation_inputs: tuple[bool, int, int] | None = None
         button_layout.addWidget(self._validation_label)
 
-        main_layout.addWidget(button_container)
+        # Coalesces validation during bursts of board edits, e.g. a held
+        # spinner arrow
+        self._validation_timer = QTimer(self)
+        self._validation_timer.setSingleShot(True)
+        self._validation_timer.setInterval(50)
+        self._validation_timer.timeout.connect(self._update_validation)
+
+        main_layout.addLayout(button_layout)
 
         # Initialize board
         self._update_board()
 
     def _setup_menu(self) -> None:
         """Set up the menu bar."""
-        menubar = self.menuBar()
-
-        # File menu
-        file_menu = menubar.addMenu("File")
-
-        new_action = QAction("New Puzzle", self)
-        new_action.setShortcut("Ctrl+N")
-        new_action.triggered.connect(self._on_new_puzzle)
-        file_menu.addAction(new_action)
-
-        file_menu.addSeparator()
-
-        save_action = QAction("Save", self)
-        save_action.setShortcut("Ctrl+S")
-        save_action.triggered.connect(self._on_save)
-        file_menu.addAction(save_action)
-
-        load_action = QAction("Load", self)
-        load_action.setShortcut("Ctrl+O")
-        load_action.triggered.connect(self._on_load)
-        file_menu.addAction(load_action)
-
-        file_menu.addSeparator()
-
-        export_action = QAction("Export...", self)
-        export_action.triggered.connect(self._on_export)
-        file_menu.addAction(export_action)
-
-        import_action = QAction("Import...", self)
-        import_action.triggered.connect(self._on_import)
-        file_menu.addAction(import_action)
-
-        file_menu.addSeparator()
-
-        exit_action = QAction("Exit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-
-        # Edit menu
-        edit_menu = menubar.addMenu("Edit")
-
-        clear_action = QAction("Clear All", self)
-        clear_action.triggered.connect(self._on_clear)
-        edit_menu.addAction(clear_action)
-
-        # Solve menu
-        solve_menu = menubar.addMenu("Solve")
+        # (menu title, entries); each entry is (text, shortcut, slot) or None
+        # for a separator
+        menus = (
+            (
+                "File",
+                (
+                    ("New Puzzle", "Ctrl+N", self._on_new_puzzle),
+                    None,
+                    ("Save", "Ctrl+S", self._on_save),
+                    ("Load", "Ctrl+O", self._on_load),
+                    None,
+                    ("Export...", None, self._on_export),
+                    ("Import...", None, self._on_import),
+                    None,
+                    ("Exit", "Ctrl+Q", self.close),
+                ),
+            ),
+            ("Edit", (("Clear All", None, self._on_clear),)),
+            ("Solve", (("Solve", "Ctrl+Enter", self._on_solve),)),
+        )
 
-        solve_action = QAction("Solve", self)
-        solve_action.setShortcut("Ctrl+Enter")
-        solve_action.triggered.connect(self._on_solve)
-        solve_menu.addAction(solve_action)
+        menubar = self.menuBar()
+        for menu_title, entries in menus:
+            menu = menubar.addMenu(menu_title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                text, shortcut, slot = entry
+                action = QAction(text, self)
+                if shortcut:
+                    action.setShortcut(shortcut)
+                action.triggered.connect(slot)
+                menu.addAction(action)
 
     def _setup_status_bar(self) -> None:
         """Set up the status bar."""
@@ -194,6 +247,179 @@ class EditorWindow(QMainWindow):
         """Get the current puzzle configuration."""
         return self._config
 
+    def _show_info(self, title: str, text: str) -> None:
+        """Show a modal information dialog, reusing a single QMessageBox.
+
+        Args:
+            title: Dialog window title
+            text: Message to display
+        """
+        if self._info_box is None:
+            self._info_box = QMessageBox(
+                QMessageBox.Icon.Information,
+                title,
+                text,
+                QMessageBox.StandardButton.Ok,
+                self,
+            )
+        else:
+            self._info_box.setWindowTitle(title)
+            self._info_box.setText(text)
+        self._info_box.exec()
+
+    def _choose_file(self, title: str, directory: Path, *, save: bool) -> Path | None:
+        """Ask the user for a puzzle file.
+
+        Each dialog is built once per title and reused on later calls.
+
+        Args:
+            title: Dialog window title
+            directory: Directory the dialog starts in
+            save: True to choose a file to write, False to pick an existing one
+
+        Returns:
+            The chosen path (with a .json suffix when saving), or None if the
+            dialog was cancelled
+        """
+        dialog = self._file_dialogs.get(title)
+        if dialog is None:
+            dialog = QFileDialog(self, title, "", "JSON Files (*.json)")
+            if save:
+                dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+                # Lets the overwrite prompt check the name that will be written
+                dialog.setDefaultSuffix("json")
+            else:
+                dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            self._file_dialogs[title] = dialog
+
+        dialog.setDirectory(str(directory))
+        if not dialog.exec() or not dialog.selectedFiles():
+            return None
+
+        filepath = Path(dialog.selectedFiles()[0])
+        if save and filepath.suffix != ".json":
+            filepath = filepath.with_suffix(".json")
+        return filepath
+
+    @contextmanager
+    def _batch_updates(self) -> Iterator[None]:
+        """Suspend repaints while several widgets are reset, then repaint once."""
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _run_io(
+        self,
+        label: str,
+        operation: Callable[[], object],
+        on_finished: Callable[[object], None],
+        on_failed: Callable[[Exception], None],
+    ) -> None:
+        """Run a file operation on the thread pool.
+
+        A window-modal progress dialog is shown if the operation is slow, and
+        the handlers run in the GUI thread once it completes.
+
+        Args:
+            label: Progress dialog text
+            operation: Callable performing the I/O
+            on_finished: Called with the operation's return value
+            on_failed: Called with the exception the operation raised
+        """
+        progress = QProgressDialog(self)
+        progress.setLabelText(label)
+        progress.setCancelButton(None)
+        progress.setRange(0, 0)
+        progress.setMinimumDuration(300)  # Quick operations never show it
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+
+        def settle(handler: Callable[[Any], None], value: object) -> None:
+            progress.reset()
+            progress.deleteLater()
+            handler(value)
+
+        start_io_task(
+            operation,
+            self,
+            partial(settle, on_finished),
+            partial(settle, on_failed),
+        )
+
+    def _on_write_failed(self, title: str, action: str, error: Exception) -> None:
+        """Report a failed save or export.
+
+        Args:
+            title: Dialog window title
+            action: Verb describing the operation (e.g. "save")
+            error: The exception raised by the write
+        """
+        if isinstance(error, OSError):
+            message = f"Failed to {action} puzzle:\n{error}"
+        else:
+            message = f"An unexpected error occurred:\n{error}"
+        QMessageBox.critical(self, title, message)
+
+    def _on_read_failed(
+        self, title: str, action: str, filepath: Path, error: Exception
+    ) -> None:
+        """Report a failed load or import.
+
+        Args:
+            title: Dialog window title
+            action: Verb describing the operation (e.g. "load")
+            filepath: File that was being read
+            error: The exception raised by the read
+        """
+        if isinstance(error, FileNotFoundError):
+            message = f"File not found:\n{filepath}"
+        elif isinstance(error, ValueError):
+            message = f"Invalid puzzle file:\n{error}"
+        elif isinstance(error, OSError):
+            message = f"Failed to {action} puzzle:\n{error}"
+        else:
+            message = f"An unexpected error occurred:\n{error}"
+        QMessageBox.critical(self, title, message)
+
+    def _schedule_updates(self, *targets: str) -> None:
+        """Mark tabs as stale and refresh the visible one.
+
+        Hidden tabs are refreshed once they are shown, so several loads or
+        resets in a row only redraw them once.
+
+        Args:
+            targets: "board" and/or "pieces"
+        """
+        self._pending_updates.update(targets)
+        self._flush_updates()
+
+    @Slot()
+    def _flush_updates(self) -> None:
+        """Refresh the current tab if it has pending updates."""
+        current = self._tab_widget.currentWidget()
+        if current is self._board_tab and "board" in self._pending_updates:
+            self._pending_updates.discard("board")
+            self._update_board()
+        elif current is self._piece_tab and "pieces" in self._pending_updates:
+            self._pending_updates.discard("pieces")
+            self._update_piece_list()
+
+    def _update_piece_list(self) -> None:
+        """Rebuild the piece tab from the current configuration."""
+        # An empty tab has nothing to clear, and clear_all() would still
+        # reset the list and repaint
+        if not self._piece_tab.is_empty:
+            self._piece_tab.clear_all()
+        if self._config.is_empty:
+            return
+
+        # Use the piece tab's internal method to add pieces with proper sorting
+        for piece, count in self._config.pieces.items():
+            self._piece_tab._pieces[piece] = count
+        self._piece_tab._refresh_piece_list()
+        self._piece_tab._update_piece_count_label()
+
     def _update_board(self) -> None:
         """Update the board tab with current configuration."""
         self._board_tab.set_dimensions(
@@ -201,57 +427,40 @@ class EditorWindow(QMainWindow):
         )
         self._board_tab.set_blocked_cells(self._config.blocked_cells)
 
+    @Slot()
     def _update_validation(self) -> None:
         """Update validation status display."""
-        # Get piece area and board area
-        piece_area = self._config.get_piece_area()
-        board_area = self._config.get_board_area() - len(self._config.blocked_cells)
-
-        if len(self._config.pieces) == 0:
-            self._validation_label.setText("No pieces defined")
-            self._validation_label.setStyleSheet("color: orange;")
-        elif piece_area > board_area:
-            self._validation_label.setText(
-                f"Warning: Piece area ({piece_area}) exceeds "
-                f"available board area ({board_area})"
-            )
-            self._validation_label.setStyleSheet("color: red;")
-        elif piece_area < board_area:
-            self._validation_label.setText(
-                f"Note: Piece area ({piece_area}) is less than "
-                f"board area ({board_area})"
-            )
-            self._validation_label.setStyleSheet("color: blue;")
-        else:
-            self._validation_label.setText("Configuration valid")
-            self._validation_label.setStyleSheet("color: green;")
+        inputs = (
+            self._config.is_empty,
+            self._config.get_piece_area(),
+            self._config.available_area,
+        )
+        if inputs == self._validation_inputs:
+            return  # Same areas, same message
+        self._validation_inputs = inputs
+
+        text, style = _validation_status(*inputs)
+        self._validation_label.setText(text)
+        # setStyleSheet() repolishes the label even for an identical sheet
+        if style != self._validation_label.styleSheet():
+            self._validation_label.setStyleSheet(style)
 
     def _on_board_dimensions_changed(self, width: int, height: int) -> None:
         """Handle board dimension changes."""
-        # Create new configuration with updated dimensions
-        self._config = PuzzleConfiguration(
-            name=self._config.name,
-            board_width=width,
-            board_height=height,
-            pieces=self._config.pieces.copy(),
-            blocked_cells=self._board_tab.blocked_cells,
-        )
+        if (width, height) == (self._config.board_width, self._config.board_height):
+            return  # Echo of _update_board() pushing the config's own size
+        self._config.resize_board(width, height)
 
-        self._update_validation()
+        self._validation_timer.start()
         self._status_bar.showMessage(f"Board size: {width}×{height}")
 
-    def _on_blocked_cells_changed(self, blocked_cells: set[tuple[int, int]]) -> None:
+    def _on_blocked_cells_changed(
+        self, blocked_cells: frozenset[tuple[int, int]]
+    ) -> None:
         """Handle blocked cells changes."""
-        # Update configuration
-        self._config = PuzzleConfiguration(
-            name=self._config.name,
-            board_width=self._config.board_width,
-            board_height=self._config.board_height,
-            pieces=self._config.pieces.copy(),
-            blocked_cells=blocked_cells,
-        )
+        self._config.set_blocked_cells(blocked_cells)
 
-        self._update_validation()
+        self._validation_timer.start()
 
     def _on_piece_added(self, piece: PuzzlePiece) -> None:
         """Handle piece added from piece tab."""
@@ -261,216 +470,178 @@ class EditorWindow(QMainWindow):
 
     def _on_piece_deleted(self, piece: PuzzlePiece) -> None:
         """Handle piece deleted from piece tab."""
-        # Sync with our configuration
-        if piece in self._config.pieces:
+        # Sync with our configuration; remove_piece() does the lookup itself,
+        # where the pieces property would copy the whole dict first. A piece
+        # that is not in the configuration raises ValueError
+        with suppress(ValueError):
             self._config.remove_piece(piece)
         self._update_validation()
 
+    @Slot()
     def _on_new_puzzle(self) -> None:
         """Handle new puzzle action."""
+        if self._config == self._create_default_config():
+            self._status_bar.showMessage("Puzzle is already empty")
+            return
+
         reply = QMessageBox.question(
             self,
             "New Puzzle",
             "Create a new puzzle? All unsaved changes will be lost.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            YES_NO,
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self._config = PuzzleConfiguration(
-                name="New Puzzle",
-                board_width=5,
-                board_height=5,
-                pieces={},
-                blocked_cells=set(),
-            )
-            self._update_board()
-            self._update_validation()
+            with self._batch_updates():
+                self._config = self._create_default_config()
+                self._schedule_updates("board")
+                self._update_validation()
             self._status_bar.showMessage("New puzzle created")
 
+    @Slot()
     def _on_save(self) -> None:
         """Handle save action."""
         SAVED_PUZZLES_DIR.mkdir(parents=True, exist_ok=True)
 
-        puzzle_name, ok = QFileDialog.getSaveFileName(
-            self,
-            "Save Puzzle",
-            str(SAVED_PUZZLES_DIR),
-            "JSON Files (*.json)",
-        )
-
-        if not ok or not puzzle_name:
+        filepath = self._choose_file("Save Puzzle", SAVED_PUZZLES_DIR, save=True)
+        if filepath is None:
             return
 
-        filepath = Path(puzzle_name)
-        if filepath.suffix != ".json":
-            filepath = filepath.with_suffix(".json")
+        # Write a snapshot so edits made while the save runs don't race it
+        self._run_io(
+            "Saving puzzle...",
+            partial(save_puzzle, self._config.copy(), filepath),
+            partial(self._on_save_finished, filepath),
+            partial(self._on_write_failed, "Save Failed", "save"),
+        )
 
-        try:
-            save_puzzle(self._config, filepath)
-            self._status_bar.showMessage(f"Puzzle saved: {filepath.name}")
-            QMessageBox.information(
-                self,
-                "Save Successful",
-                f"Puzzle saved to:\n{filepath}",
-            )
-            self._saved_puzzles_tab.refresh()
-        except OSError as e:
-            QMessageBox.critical(
-                self,
-                "Save Failed",
-                f"Failed to save puzzle:\n{e}",
-            )
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Save Failed",
-                f"An unexpected error occurred:\n{e}",
-            )
+    def _on_save_finished(self, filepath: Path, _result: object) -> None:
+        """Report a completed save and list the new file.
 
+        Args:
+            filepath: Path the puzzle was saved to
+        """
+        self._status_bar.showMessage(f"Puzzle saved: {filepath.name}")
+        self._show_info(
+            "Save Successful",
+            f"Puzzle saved to:\n{filepath}",
+        )
+        # The directory mtime may not have ticked since the last scan
+        self._saved_puzzles_tab.refresh(force=True)
+
+    @Slot()
     def _on_load(self) -> None:
         """Handle load action."""
         SAVED_PUZZLES_DIR.mkdir(parents=True, exist_ok=True)
 
-        filepath, ok = QFileDialog.getOpenFileName(
-            self,
-            "Load Puzzle",
-            str(SAVED_PUZZLES_DIR),
-            "JSON Files (*.json)",
-        )
-
-        if not ok or not filepath:
+        filepath = self._choose_file("Load Puzzle", SAVED_PUZZLES_DIR, save=False)
+        if filepath is None:
             return
 
-        self._load_puzzle_from_file(Path(filepath))
+        self._load_puzzle_from_file(filepath)
 
+    @Slot()
     def _on_export(self) -> None:
         """Handle export action."""
-        filepath, ok = QFileDialog.getSaveFileName(
-            self,
-            "Export Puzzle",
-            "",
-            "JSON Files (*.json)",
+        export_path = self._choose_file(
+            "Export Puzzle", self._last_export_dir, save=True
         )
-
-        if not ok or not filepath:
+        if export_path is None:
             return
 
-        export_path = Path(filepath)
-        if export_path.suffix != ".json":
-            export_path = export_path.with_suffix(".json")
+        self._last_export_dir = export_path.parent
 
-        try:
-            export_puzzle(self._config, export_path)
-            self._status_bar.showMessage(f"Puzzle exported: {export_path.name}")
-            QMessageBox.information(
-                self,
-                "Export Successful",
-                f"Puzzle exported to:\n{export_path}",
-            )
-        except OSError as e:
-            QMessageBox.critical(
-                self,
-                "Export Failed",
-                f"Failed to export puzzle:\n{e}",
-            )
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Export Failed",
-                f"An unexpected error occurred:\n{e}",
-            )
+        self._run_io(
+            "Exporting puzzle...",
+            partial(export_puzzle, self._config.copy(), export_path),
+            partial(self._on_export_finished, export_path),
+            partial(self._on_write_failed, "Export Failed", "export"),
+        )
 
-    def _on_import(self) -> None:
-        """Handle import action."""
-        filepath, ok = QFileDialog.getOpenFileName(
-            self,
-            "Import Puzzle",
-            "",
-            "JSON Files (*.json)",
+    def _on_export_finished(self, export_path: Path, _result: object) -> None:
+        """Report a completed export.
+
+        Args:
+            export_path: Path the puzzle was exported to
+        """
+        self._status_bar.showMessage(f"Puzzle exported: {export_path.name}")
+        self._show_info(
+            "Export Successful",
+            f"Puzzle exported to:\n{export_path}",
         )
 
-        if not ok or not filepath:
+    @Slot()
+    def _on_import(self) -> None:
+        """Handle import action."""
+        path = self._choose_file("Import Puzzle", self._last_export_dir, save=False)
+        if path is None:
             return
 
-        path = Path(filepath)
+        self._last_export_dir = path.parent
+        self._run_io(
+            "Importing puzzle...",
+            partial(import_puzzle, path),
+            partial(self._on_import_finished, path),
+            partial(self._on_read_failed, "Import Failed", "import", path),
+        )
 
-        try:
-            loaded_config = import_puzzle(path)
+    def _on_import_finished(
+        self, path: Path, loaded_config: PuzzleConfiguration
+    ) -> None:
+        """Apply a configuration read by _on_import.
 
-            loaded_config.name = loaded_config.name or "Imported Puzzle"
-            self._config = loaded_config
-            self._update_board()
-            self._update_validation()
+        Args:
+            path: File the configuration was imported from
+            loaded_config: The imported configuration
+        """
+        self._apply_loaded_config(loaded_config)
+        self._status_bar.showMessage(f"Imported puzzle: {path.name}")
+
+        self._show_info(
+            "Import Successful",
+            f"Puzzle imported:\n{path.name}\n\n"
+            f"Board: {self._config.board_width}x{self._config.board_height}\n"
+            f"Piece types: {len(self._config.pieces)}",
+        )
 
-            # Use the piece tab's internal method to add pieces with proper sorting
-            self._piece_tab.clear_all()
-            for piece, count in self._config.pieces.items():
-                self._piece_tab._pieces[piece] = count
-            self._piece_tab._refresh_piece_list()
-            self._piece_tab._piece_count_label.setText(
-                f"Pieces: {len(self._piece_tab._get_all_pieces())}"
-            )
+    def _apply_loaded_config(self, loaded_config: PuzzleConfiguration) -> None:
+        """Make a configuration read from disk the current one.
 
-            self._status_bar.showMessage(f"Imported puzzle: {path.name}")
+        Args:
+            loaded_config: The configuration read from a file
+        """
+        loaded_config.name = loaded_config.name or "Imported Puzzle"
+        if loaded_config == self._config:
+            return  # e.g. the open puzzle was reloaded; nothing to redraw
 
-            QMessageBox.information(
-                self,
-                "Import Successful",
-                f"Puzzle imported:\n{path.name}\n\n"
-                f"Board: {self._config.board_width}x{self._config.board_height}\n"
-                f"Piece types: {len(self._config.pieces)}",
-            )
-        except FileNotFoundError:
-            QMessageBox.critical(
-                self,
-                "Import Failed",
-                f"File not found:\n{path}",
-            )
-        except ValueError as e:
-            QMessageBox.critical(
-                self,
-                "Import Failed",
-                f"Invalid puzzle file:\n{e}",
-            )
-        except OSError as e:
-            QMessageBox.critical(
-                self,
-                "Import Failed",
-                f"Failed to import puzzle:\n{e}",
-            )
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Import Failed",
-                f"An unexpected error occurred:\n{e}",
-            )
+        with self._batch_updates():
+            self._config = loaded_config
+            self._schedule_updates("board", "pieces")
+            self._update_validation()
 
+    @Slot()
     def _on_clear(self) -> None:
         """Handle clear action."""
         reply = QMessageBox.question(
             self,
             "Clear All",
             "Clear all pieces and reset board?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            YES_NO,
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self._config = PuzzleConfiguration(
-                name=self._config.name,
-                board_width=self._config.board_width,
-                board_height=self._config.board_height,
-                pieces={},
-                blocked_cells=set(),
-            )
-            self._update_board()
-            self._update_validation()
-            self._piece_tab.clear_all()
+            with self._batch_updates():
+                self._config.clear_pieces()
+                self._config.set_blocked_cells(())
+                self._schedule_updates("board", "pieces")
+                self._update_validation()
             self._status_bar.showMessage("Cleared all pieces and reset board")
 
+    @Slot()
     def _on_solve(self) -> None:
         """Handle solve action."""
         # Validate configuration
-        if len(self._config.pieces) == 0:
+        if self._config.is_empty:
             QMessageBox.warning(
                 self,
                 "No Pieces",
@@ -480,24 +651,43 @@ class EditorWindow(QMainWindow):
 
         # Check if configuration is valid
         piece_area = self._config.get_piece_area()
-        board_area = self._config.get_board_area() - len(self._config.blocked_cells)
+        board_area = self._config.available_area
 
         if piece_area > board_area:
             reply = QMessageBox.question(
                 self,
                 "Configuration Warning",
                 f"Warning: Total piece area ({piece_area}) exceeds available board area ({board_area}).\n\nThe puzzle may not have a solution.\n\nDo you want to try solving anyway?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                YES_NO,
             )
             if reply == QMessageBox.StandardButton.No:
                 return
 
-        # Create and show visualization window
-        viz_window = VisualizationWindow(self._config)
+        # Create and show visualization window; imported here since most
+        # editing sessions never open it
+        from src.gui.visualization_window import VisualizationWindow
+
+        # Snapshot the config; the editor keeps mutating its own copy in place.
+        # Owned by the editor and freed on close, so finished solves don't
+        # pile up
+        viz_window = VisualizationWindow(self._config.copy(), self)
+        viz_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        # Strong references: a wrapper only weakly referenced is freed inside
+        # Qt's destructor when its window is deleted, which is not safe
+        self._viz_windows = [window for window in self._viz_windows if isValid(window)]
+        self._viz_windows.append(viz_window)
         viz_window.show()
 
         self._status_bar.showMessage("Solving...")
 
+    @override
+    def showEvent(self, event: QShowEvent) -> None:
+        """Build the menu bar the first time the window is shown."""
+        if not self._menu_built:
+            self._setup_menu()
+            self._menu_built = True
+        super().showEvent(event)
+
     @override
     def closeEvent(self, event: QEvent) -> None:
         """Handle close event."""
@@ -505,67 +695,50 @@ class EditorWindow(QMainWindow):
             self,
             "Exit",
             "Exit the application?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            YES_NO,
         )
 
         if reply == QMessageBox.StandardButton.No:
             event.ignore()
         else:
+            # Stop any running solves; open solver windows would otherwise
+            # keep the application alive
+            for viz_window in self._viz_windows:
+                if isValid(viz_window):
+                    viz_window.close()
             event.accept()
 
     def _load_puzzle_from_file(self, filepath: Path) -> None:
         """Load a puzzle configuration from a file.
 
+        The file is read in the background; the editor is updated once the
+        read completes.
+
         Args:
             filepath: Path to the puzzle file
         """
-        try:
-            loaded_config = load_puzzle(filepath)
-
-            loaded_config.name = loaded_config.name or "Imported Puzzle"
-            self._config = loaded_config
-            self._update_board()
-            self._update_validation()
-
-            # Use the piece tab's internal method to add pieces with proper sorting
-            self._piece_tab.clear_all()
-            for piece, count in self._config.pieces.items():
-                self._piece_tab._pieces[piece] = count
-            self._piece_tab._refresh_piece_list()
-            self._piece_tab._piece_count_label.setText(
-                f"Pieces: {len(self._piece_tab._get_all_pieces())}"
-            )
+        self._run_io(
+            "Loading puzzle...",
+            partial(load_puzzle, filepath),
+            partial(self._on_load_finished, filepath),
+            partial(self._on_read_failed, "Load Failed", "load", filepath),
+        )
 
-            self._status_bar.showMessage(f"Loaded puzzle: {filepath.name}")
+    def _on_load_finished(
+        self, filepath: Path, loaded_config: PuzzleConfiguration
+    ) -> None:
+        """Apply a configuration read by _load_puzzle_from_file.
 
-            QMessageBox.information(
-                self,
-                "Load Successful",
-                f"Puzzle loaded:\n{filepath.name}\n\n"
-                f"Board: {self._config.board_width}x{self._config.board_height}\n"
-                f"Piece types: {len(self._config.pieces)}",
-            )
-        except FileNotFoundError:
-            QMessageBox.critical(
-                self,
-                "Load Failed",
-                f"File not found:\n{filepath}",
-            )
-        except ValueError as e:
-            QMessageBox.critical(
-                self,
-                "Load Failed",
-                f"Invalid puzzle file:\n{e}",
-            )
-        except OSError as e:
-            QMessageBox.critical(
-                self,
-                "Load Failed",
-                f"Failed to load puzzle:\n{e}",
-            )
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Load Failed",
-                f"An unexpected error occurred:\n{e}",
-            )
+        Args:
+            filepath: Path the configuration was loaded from
+            loaded_config: The loaded configuration
+        """
+        self._apply_loaded_config(loaded_config)
+        self._status_bar.showMessage(f"Loaded puzzle: {filepath.name}")
+
+        self._show_info(
+            "Load Successful",
+            f"Puzzle loaded:\n{filepath.name}\n\n"
+            f"Board: {self._config.board_width}x{self._config.board_height}\n"
+            f"Piece types: {len(self._config.pieces)}",
+        )
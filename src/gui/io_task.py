@@ -0,0 +1,126 @@
+"""Background file I/O for the puzzle editor.
+
+This module provides start_io_task(), which runs a file operation on the
+global thread pool and reports the outcome back to the GUI thread.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from itertools import count
+from typing import Any, override
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+from shiboken6 import isValid
+
+
+class _IoDispatcher(QObject):
+    """Routes task outcomes from worker threads to their callbacks.
+
+    A single dispatcher lives in the GUI thread for the whole session, so
+    workers always emit on a live object and the outcome is queued back to
+    the GUI thread. Callbacks whose owner has been destroyed are dropped.
+
+    Signals:
+        finished: Emitted with a task key and the operation's return value
+        failed: Emitted with a task key and the exception the operation raised
+    """
+
+    finished = Signal(object, object)
+    failed = Signal(object, object)
+
+    def __init__(self) -> None:
+        """Initialize the dispatcher."""
+        super().__init__()
+        self._keys = count()
+        self._pending: dict[
+            int,
+            tuple[QObject, Callable[[Any], None], Callable[[Exception], None]],
+        ] = {}
+        self.finished.connect(self._deliver_result)
+        self.failed.connect(self._deliver_error)
+
+    def register(
+        self,
+        owner: QObject,
+        on_finished: Callable[[Any], None],
+        on_failed: Callable[[Exception], None],
+    ) -> int:
+        """Store the callbacks of a new task.
+
+        Returns:
+            Key the task reports its outcome under
+        """
+        key = next(self._keys)
+        self._pending[key] = (owner, on_finished, on_failed)
+        return key
+
+    @Slot(object, object)
+    def _deliver_result(self, key: int, result: object) -> None:
+        """Hand a task's result to its owner, if still alive."""
+        owner, on_finished, _on_failed = self._pending.pop(key)
+        if isValid(owner):
+            on_finished(result)
+
+    @Slot(object, object)
+    def _deliver_error(self, key: int, error: Exception) -> None:
+        """Hand a task's exception to its owner, if still alive."""
+        owner, _on_finished, on_failed = self._pending.pop(key)
+        if isValid(owner):
+            on_failed(error)
+
+
+class IoTask(QRunnable):
+    """Runs a file operation on a worker thread."""
+
+    def __init__(
+        self, operation: Callable[[], object], dispatcher: _IoDispatcher, key: int
+    ) -> None:
+        """Initialize the task.
+
+        Args:
+            operation: Callable performing the I/O
+            dispatcher: Dispatcher the outcome is emitted through
+            key: Key the outcome is reported under
+        """
+        super().__init__()
+        self._operation = operation
+        self._dispatcher = dispatcher
+        self._key = key
+
+    @override
+    def run(self) -> None:
+        """Run the operation and emit its result or exception."""
+        try:
+            result = self._operation()
+        except Exception as e:
+            self._dispatcher.failed.emit(self._key, e)
+        else:
+            self._dispatcher.finished.emit(self._key, result)
+
+
+_dispatcher: _IoDispatcher | None = None
+
+
+def start_io_task(
+    operation: Callable[[], object],
+    owner: QObject,
+    on_finished: Callable[[Any], None],
+    on_failed: Callable[[Exception], None],
+) -> None:
+    """Run a file operation on the global thread pool.
+
+    Must be called from the GUI thread. The callbacks run there once the
+    operation completes, and are dropped if ``owner`` is destroyed first.
+
+    Args:
+        operation: Callable performing the I/O
+        owner: Object whose lifetime bounds the callbacks
+        on_finished: Called with the operation's return value
+        on_failed: Called with the exception the operation raised
+    """
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = _IoDispatcher()
+    key = _dispatcher.register(owner, on_finished, on_failed)
+    QThreadPool.globalInstance().start(IoTask(operation, _dispatcher, key))
@@ -8,8 +8,16 @@ from __future__ import annotations
 
 from collections.abc import Callable
 
-from PySide6.QtCore import QSize, Qt, Signal
-from PySide6.QtGui import QColor, QPainter, QPaintEvent, QPen, QResizeEvent
+from PySide6.QtCore import QLine, QRect, QSize, Qt, Signal, Slot
+from PySide6.QtGui import (
+    QColor,
+    QFont,
+    QImage,
+    QPainter,
+    QPaintEvent,
+    QPen,
+    QResizeEvent,
+)
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -24,6 +32,13 @@ from PySide6.QtWidgets import (
 )
 
 from src.models.piece import PuzzlePiece
+from src.utils.bitgrid import (
+    cells_to_rows,
+    count_cells,
+    iter_cells,
+    resize_rows,
+    rows_to_cells,
+)
 
 
 class PieceGridWidget(QWidget):
@@ -43,7 +58,10 @@ class PieceGridWidget(QWidget):
     MAX_CELL_SIZE = 50
     DEFAULT_CELL_SIZE = 30
     FILL_COLOR = QColor(0, 123, 255)  # Blue for filled cells
+    EMPTY_COLOR = QColor(255, 255, 255)  # White for empty cells
     GRID_COLOR = QColor(180, 180, 180)  # Medium gray for grid lines
+    LABEL_COLOR = QColor(100, 100, 100)  # Dark gray for row/column labels
+    GRID_PEN = QPen(GRID_COLOR, 1)
 
     def __init__(self, parent: QWidget | None = None) -> None:
         """Initialize the piece grid widget.
@@ -55,9 +73,10 @@ class PieceGridWidget(QWidget):
 
         self._grid_width = 10
         self._grid_height = 10
-        self._filled_cells: set[tuple[int, int]] = set()
+        self._filled_rows: list[int] = [0] * self._grid_height  # One bitmask per row
         self._cell_size = self.DEFAULT_CELL_SIZE
         self._is_filling = True  # True = add cells, False = remove cells
+        self._grid_lines: list[QLine] | None = None  # Cached, origin-relative
 
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -75,8 +94,12 @@ class PieceGridWidget(QWidget):
         Args:
             value: New width (1-50)
         """
-        self._grid_width = max(1, min(50, value))
+        value = max(1, min(50, value))
+        if value == self._grid_width:
+            return
+        self._grid_width = value
         self._trim_filled_cells()
+        self._grid_lines = None
         self.updateGeometry()
         self.update()
 
@@ -92,15 +115,19 @@ class PieceGridWidget(QWidget):
         Args:
             value: New height (1-50)
         """
-        self._grid_height = max(1, min(50, value))
+        value = max(1, min(50, value))
+        if value == self._grid_height:
+            return
+        self._grid_height = value
         self._trim_filled_cells()
+        self._grid_lines = None
         self.updateGeometry()
         self.update()
 
     @property
     def filled_cells(self) -> set[tuple[int, int]]:
         """Get the set of filled cell positions."""
-        return self._filled_cells.copy()
+        return rows_to_cells(self._filled_rows)
 
     @filled_cells.setter
     def filled_cells(self, cells: set[tuple[int, int]]) -> None:
@@ -109,17 +136,22 @@ class PieceGridWidget(QWidget):
         Args:
             cells: Set of (row, col) positions to mark as filled
         """
-        self._filled_cells = cells.copy()
-        self._trim_filled_cells()
+        rows = cells_to_rows(cells, self._grid_width, self._grid_height)
+        if rows == self._filled_rows:
+            return  # e.g. re-selecting the piece already shown
+        self._filled_rows = rows
         self.update()
 
+    @property
+    def filled_count(self) -> int:
+        """Get the number of filled cells."""
+        return count_cells(self._filled_rows)
+
     def _trim_filled_cells(self) -> None:
         """Remove filled cells that are outside the grid bounds."""
-        self._filled_cells = {
-            (r, c)
-            for r, c in self._filled_cells
-            if 0 <= r < self._grid_height and 0 <= c < self._grid_width
-        }
+        self._filled_rows = resize_rows(
+            self._filled_rows, self._grid_width, self._grid_height
+        )
 
     def set_dimensions(self, width: int, height: int) -> None:
         """Set grid dimensions.
@@ -128,16 +160,23 @@ class PieceGridWidget(QWidget):
             width: New width (1-50)
             height: New height (1-50)
         """
-        self._grid_width = max(1, min(50, width))
-        self._grid_height = max(1, min(50, height))
+        width = max(1, min(50, width))
+        height = max(1, min(50, height))
+        if (width, height) == (self._grid_width, self._grid_height):
+            return
+        self._grid_width = width
+        self._grid_height = height
         self._trim_filled_cells()
         self._calculate_cell_size()
+        self._grid_lines = None
         self.updateGeometry()
         self.update()
 
     def clear(self) -> None:
         """Clear all filled cells."""
-        self._filled_cells.clear()
+        if not any(self._filled_rows):
+            return
+        self._filled_rows = [0] * self._grid_height
         self.update()
 
     def resizeEvent(self, event: QResizeEvent) -> None:
@@ -155,9 +194,13 @@ class PieceGridWidget(QWidget):
         if self._grid_width > 0 and self._grid_height > 0:
             cell_width = available_width // self._grid_width
             cell_height = available_height // self._grid_height
-            self._cell_size = max(
+            cell_size = max(
                 self.MIN_CELL_SIZE, min(cell_width, cell_height, self.MAX_CELL_SIZE)
             )
+            # Most resizes keep the same cell size; keep the cached lines then
+            if cell_size != self._cell_size:
+                self._cell_size = cell_size
+                self._grid_lines = None
 
     def sizeHint(self) -> QSize:
         """Return the preferred size hint."""
@@ -174,48 +217,55 @@ class PieceGridWidget(QWidget):
     def paintEvent(self, event: QPaintEvent) -> None:
         """Paint the grid."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Extra padding for labels
-        label_padding = 25
-        grid_width = self._grid_width * self._cell_size
-        grid_height = self._grid_height * self._cell_size
-        offset_x = (self.width() - grid_width) // 2
-        offset_y = (self.height() - grid_height) // 2
-
-        # Ensure labels have enough space
-        offset_x = max(offset_x, label_padding)
-        offset_y = max(offset_y, label_padding)
-
-        # Draw cells
-        for row in range(self._grid_height):
-            for col in range(self._grid_width):
-                x = offset_x + col * self._cell_size
-                y = offset_y + row * self._cell_size
-
-                # Determine cell color
-                if (row, col) in self._filled_cells:
-                    color = self.FILL_COLOR
-                else:
-                    color = QColor(255, 255, 255)
-
-                painter.fillRect(x, y, self._cell_size, self._cell_size, color)
+        cell_size = self._cell_size
+        offset_x, offset_y = self._grid_origin()
+
+        # Only cells intersecting the dirty rect need repainting
+        dirty = event.rect()
+        col_start = max(0, (dirty.left() - offset_x) // cell_size)
+        col_end = min(self._grid_width, (dirty.right() - offset_x) // cell_size + 1)
+        row_start = max(0, (dirty.top() - offset_y) // cell_size)
+        row_end = min(self._grid_height, (dirty.bottom() - offset_y) // cell_size + 1)
+        visible_cols = col_end - col_start
+        visible_rows = row_end - row_start
+
+        # Draw cells as a single image blit: one pixel per cell, scaled up
+        if visible_cols > 0 and visible_rows > 0:
+            image = QImage(visible_cols, visible_rows, QImage.Format.Format_RGB32)
+            image.fill(self.EMPTY_COLOR)
+            col_mask = (1 << visible_cols) - 1
+            visible_masks = [
+                (mask >> col_start) & col_mask
+                for mask in self._filled_rows[row_start:row_end]
+            ]
+            for row, col in iter_cells(visible_masks):
+                image.setPixelColor(col, row, self.FILL_COLOR)
+            painter.drawImage(
+                QRect(
+                    offset_x + col_start * cell_size,
+                    offset_y + row_start * cell_size,
+                    visible_cols * cell_size,
+                    visible_rows * cell_size,
+                ),
+                image,
+            )
 
-                # Draw grid lines
-                pen = QPen(self.GRID_COLOR)
-                pen.setWidth(1)
-                painter.setPen(pen)
-                painter.drawRect(x, y, self._cell_size, self._cell_size)
+        # Draw grid lines in one batched call
+        painter.setPen(self.GRID_PEN)
+        painter.translate(offset_x, offset_y)
+        painter.drawLines(self._get_grid_lines())
+        painter.translate(-offset_x, -offset_y)
 
         # Draw row/column labels if cells are large enough
         if self._cell_size >= 20:
             font = painter.font()
             font.setPointSize(max(7, min(10, self._cell_size // 3)))
             painter.setFont(font)
-            painter.setPen(QColor(100, 100, 100))
+            painter.setPen(self.LABEL_COLOR)
 
             # Column labels (top)
-            for col in range(self._grid_width):
+            for col in range(col_start, col_end):
                 x = offset_x + col * self._cell_size + self._cell_size // 2
                 y = offset_y - 8
                 label = str(col)
@@ -224,7 +274,7 @@ class PieceGridWidget(QWidget):
                 painter.drawText(int(x - text_width // 2), int(y), label)
 
             # Row labels (left)
-            for row in range(self._grid_height):
+            for row in range(row_start, row_end):
                 x = offset_x - 8
                 y = offset_y + row * self._cell_size + self._cell_size // 2
                 label = str(row)
@@ -236,6 +286,56 @@ class PieceGridWidget(QWidget):
                     label,
                 )
 
+    def _grid_origin(self) -> tuple[int, int]:
+        """Get the widget position of the grid's top-left corner.
+
+        Returns:
+            (x, y) offset that centers the grid, leaving room for labels
+        """
+        # Extra padding for labels
+        label_padding = 25
+        offset_x = (self.width() - self._grid_width * self._cell_size) // 2
+        offset_y = (self.height() - self._grid_height * self._cell_size) // 2
+        return max(offset_x, label_padding), max(offset_y, label_padding)
+
+    def _cell_rect(self, row: int, col: int) -> QRect:
+        """Get the widget area covered by a cell, including its border.
+
+        Args:
+            row: Cell row
+            col: Cell column
+
+        Returns:
+            QRect to pass to update() when only this cell changed
+        """
+        offset_x, offset_y = self._grid_origin()
+        return QRect(
+            offset_x + col * self._cell_size,
+            offset_y + row * self._cell_size,
+            self._cell_size,
+            self._cell_size,
+        ).adjusted(-1, -1, 1, 1)
+
+    def _get_grid_lines(self) -> list[QLine]:
+        """Get the grid lines relative to the grid's top-left corner.
+
+        The list is cached until the dimensions or cell size change.
+
+        Returns:
+            Vertical then horizontal lines bounding every cell
+        """
+        if self._grid_lines is None:
+            grid_width = self._grid_width * self._cell_size
+            grid_height = self._grid_height * self._cell_size
+            self._grid_lines = [
+                QLine(x, 0, x, grid_height)
+                for x in range(0, grid_width + 1, self._cell_size)
+            ] + [
+                QLine(0, y, grid_width, y)
+                for y in range(0, grid_height + 1, self._cell_size)
+            ]
+        return self._grid_lines
+
     def _get_cell_at_position(self, pos_x: int, pos_y: int) -> tuple[int, int] | None:
         """Get the cell coordinates at the given position.
 
@@ -246,17 +346,9 @@ class PieceGridWidget(QWidget):
         Returns:
             (row, col) tuple or None if position is outside the grid
         """
-        grid_width = self._grid_width * self._cell_size
-        grid_height = self._grid_height * self._cell_size
-        offset_x = (self.width() - grid_width) // 2
-        offset_y = (self.height() - grid_height) // 2
-
-        # Check if position is within grid bounds
-        if pos_x < offset_x or pos_x >= offset_x + grid_width:
-            return None
-        if pos_y < offset_y or pos_y >= offset_y + grid_height:
-            return None
-
+        # Use the same origin as paintEvent so clicks land on the drawn cell;
+        # positions left of or above the grid floor-divide to negative indices
+        offset_x, offset_y = self._grid_origin()
         col = (pos_x - offset_x) // self._cell_size
         row = (pos_y - offset_y) // self._cell_size
 
@@ -289,12 +381,16 @@ class PieceGridWidget(QWidget):
             pos: QPoint position
         """
         cell = self._get_cell_at_position(pos.x(), pos.y())
-        if cell is not None:
-            if self._is_filling:
-                self._filled_cells.add(cell)
-            else:
-                self._filled_cells.discard(cell)
-            self.update()
+        if cell is None:
+            return
+
+        row, col = cell
+        bit = 1 << col
+        if bool(self._filled_rows[row] & bit) == self._is_filling:
+            return  # Already in the requested state, e.g. dragging within a cell
+
+        self._filled_rows[row] ^= bit
+        self.update(self._cell_rect(row, col))
 
 
 class PieceListItemWidget(QWidget):
@@ -308,6 +404,11 @@ class PieceListItemWidget(QWidget):
     increment_requested = Signal(PuzzlePiece)
     decrement_requested = Signal(PuzzlePiece)
 
+    # Fonts shared by every row, built on first use (QFont needs a running
+    # QApplication); cheaper than a style sheet per label
+    _label_font: QFont | None = None
+    _count_font: QFont | None = None
+
     def __init__(
         self, piece: PuzzlePiece, count: int, parent: QWidget | None = None
     ) -> None:
@@ -329,10 +430,18 @@ class PieceListItemWidget(QWidget):
         layout.setContentsMargins(4, 4, 4, 4)
         layout.setSpacing(4)
 
+        if PieceListItemWidget._label_font is None:
+            label_font = QFont()
+            label_font.setBold(True)
+            count_font = QFont(label_font)
+            count_font.setPixelSize(14)
+            PieceListItemWidget._label_font = label_font
+            PieceListItemWidget._count_font = count_font
+
         # Label: "(3×4) (7 cells)"
         self._label = QLabel(self._get_label_text())
         self._label.setMinimumWidth(100)
-        self._label.setStyleSheet("font-weight: bold;")
+        self._label.setFont(PieceListItemWidget._label_font)
 
         # Minus button
         self._minus_btn = QToolButton()
@@ -344,7 +453,7 @@ class PieceListItemWidget(QWidget):
         # Count label: "x3"
         self._count_label = QLabel(self._get_count_text())
         self._count_label.setFixedWidth(30)
-        self._count_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        self._count_label.setFont(PieceListItemWidget._count_font)
 
         # Plus button
         self._plus_btn = QToolButton()
@@ -367,10 +476,12 @@ class PieceListItemWidget(QWidget):
         """Generate count text like 'x3'."""
         return f"x{self._count}"
 
+    @Slot()
     def _on_plus_clicked(self) -> None:
         """Handle plus button click."""
         self.increment_requested.emit(self._piece)
 
+    @Slot()
     def _on_minus_clicked(self) -> None:
         """Handle minus button click."""
         self.decrement_requested.emit(self._piece)
@@ -426,6 +537,7 @@ class PieceTab(QWidget):
 
         self._pieces: dict[PuzzlePiece, int] = {}
         self._selected_piece: PuzzlePiece | None = None
+        self._piece_rows: dict[PuzzlePiece, int] = {}  # List row of each piece
         self._piece_counter = 0  # Only for generating unique labels
 
         self._piece_selected_callback = on_piece_selected
@@ -455,6 +567,9 @@ class PieceTab(QWidget):
         self._piece_list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
         self._piece_list.setFixedWidth(200)
         self._piece_list.setUniformItemSizes(True)
+        # Lay out rows in batches so a refresh doesn't relayout per insertion
+        self._piece_list.setLayoutMode(QListWidget.LayoutMode.Batched)
+        self._piece_list.setBatchSize(32)
         self._piece_list.setStyleSheet("QListWidget::item { min-height: 40px; }")
         self._piece_list.itemSelectionChanged.connect(self._on_piece_selection_changed)
         self._piece_list.itemClicked.connect(self._on_piece_item_clicked)
@@ -508,6 +623,8 @@ class PieceTab(QWidget):
         self._width_spinner.setRange(1, 20)
         self._width_spinner.setValue(10)
         self._width_spinner.setFixedWidth(80)
+        # Apply typed values on Enter/focus-out, not per keystroke
+        self._width_spinner.setKeyboardTracking(False)
         self._width_spinner.valueChanged.connect(self._on_grid_size_changed)
 
         height_label = QLabel("Height:")
@@ -515,6 +632,7 @@ class PieceTab(QWidget):
         self._height_spinner.setRange(1, 20)
         self._height_spinner.setValue(10)
         self._height_spinner.setFixedWidth(80)
+        self._height_spinner.setKeyboardTracking(False)
         self._height_spinner.valueChanged.connect(self._on_grid_size_changed)
 
         grid_size_layout.addWidget(width_label)
@@ -543,18 +661,14 @@ class PieceTab(QWidget):
         main_layout.setStretch(0, 1)
         main_layout.setStretch(1, 3)
 
+    @Slot()
     def _on_piece_selection_changed(self) -> None:
         """Handle piece selection changes."""
         selected_items = self._piece_list.selectedItems()
         if selected_items:
-            index = self._piece_list.row(selected_items[0])
-            # Sort pieces the same way as _refresh_piece_list
-            sorted_pieces = sorted(
-                self._pieces.keys(),
-                key=lambda p: len(p.canonical_shape),
-            )
-            if 0 <= index < len(sorted_pieces):
-                self._selected_piece = sorted_pieces[index]
+            piece = selected_items[0].data(Qt.ItemDataRole.UserRole)
+            if piece in self._pieces:
+                self._selected_piece = piece
                 # Load the piece shape into the grid
                 shape = self._selected_piece.canonical_shape
                 self._grid_widget.filled_cells = set(shape)
@@ -568,15 +682,23 @@ class PieceTab(QWidget):
         if self._piece_selected_callback:
             self._piece_selected_callback(self._selected_piece)
 
+    @Slot(QListWidgetItem)
     def _on_piece_item_clicked(self, item: QListWidgetItem) -> None:
         """Handle clicking on a piece list item.
 
         This ensures selection is properly handled when clicking on
         the custom widget area.
         """
-        # Just trigger the selection changed handler to ensure consistency
+        piece = item.data(Qt.ItemDataRole.UserRole)
+        if piece == self._selected_piece and self._grid_widget.filled_cells == set(
+            piece.canonical_shape
+        ):
+            return  # itemSelectionChanged already loaded this piece
+
+        # Re-run the selection handler, e.g. to restore an edited shape
         self._on_piece_selection_changed()
 
+    @Slot()
     def _on_add_piece(self) -> None:
         """Handle adding a new piece."""
         # Create new piece from current grid
@@ -589,16 +711,16 @@ class PieceTab(QWidget):
 
         # Check if this shape already exists (uses canonical shape comparison)
         if new_piece in self._pieces:
-            # Increment count for existing piece
+            # Increment count for existing piece; only its row changes
             self._pieces[new_piece] += 1
+            self._update_piece_count_widget(new_piece)
         else:
-            # Add new piece with count 1
+            # Add new piece with count 1 at its sorted position
             self._pieces[new_piece] = 1
+            self._refresh_piece_list()
 
-        # Refresh list with custom widgets
-        self._refresh_piece_list()
         self._select_piece_in_list(new_piece)
-        self._piece_count_label.setText(f"Pieces: {len(self._get_all_pieces())}")
+        self._update_piece_count_label()
         self.piece_added.emit(new_piece)
         if self._piece_added_callback:
             self._piece_added_callback(new_piece)
@@ -691,14 +813,7 @@ class PieceTab(QWidget):
         Returns:
             The index in the sorted pieces list, or -1 if not found
         """
-        sorted_pieces = sorted(
-            self._pieces.keys(),
-            key=lambda p: len(p.canonical_shape),
-        )
-        try:
-            return sorted_pieces.index(piece)
-        except ValueError:
-            return -1
+        return self._piece_rows.get(piece, -1)
 
     def _get_all_pieces(self) -> list[PuzzlePiece]:
         """Get a flat list of all pieces with counts expanded.
@@ -712,38 +827,65 @@ class PieceTab(QWidget):
         return all_pieces
 
     def _refresh_piece_list(self) -> None:
-        """Refresh all list items with custom widgets showing counts.
+        """Sync list items and their count widgets with the pieces.
 
-        Pieces are automatically sorted by number of cells (ascending).
+        Pieces are automatically sorted by number of cells (ascending). Rows
+        whose piece is still present keep their widget and only get their
+        count updated; rows are inserted or removed only where pieces changed.
         """
-        self._piece_list.clear()
+        # Like a full rebuild, a refresh leaves nothing selected or current, so
+        # removing the current row cannot move the selection to a neighbour
+        self._piece_list.setCurrentRow(-1)
 
-        # Sort pieces by number of cells (ascending order)
-        sorted_pieces = sorted(
-            self._pieces.items(),
-            key=lambda item: len(item[0].canonical_shape),
-        )
-
-        for piece, count in sorted_pieces:
-            item = QListWidgetItem()
-            item.setData(Qt.ItemDataRole.UserRole, piece)
-
-            widget = PieceListItemWidget(piece, count)
-            widget.increment_requested.connect(self._on_piece_increment)
-            widget.decrement_requested.connect(self._on_piece_decrement)
+        # Inserting many rows (e.g. on load) should cost one repaint, not one each
+        self._piece_list.setUpdatesEnabled(False)
+        try:
+            # Drop rows for pieces that no longer exist
+            for row in reversed(range(self._piece_list.count())):
+                piece = self._piece_list.item(row).data(Qt.ItemDataRole.UserRole)
+                if piece not in self._pieces:
+                    self._piece_list.takeItem(row)
 
-            self._piece_list.addItem(item)
-            self._piece_list.setItemWidget(item, widget)
+            # Sort pieces by number of cells (ascending order)
+            sorted_pieces = sorted(
+                self._pieces.items(),
+                key=lambda item: len(item[0].canonical_shape),
+            )
 
+            self._piece_rows.clear()
+            for row, (piece, count) in enumerate(sorted_pieces):
+                self._piece_rows[piece] = row
+                item = self._piece_list.item(row)
+                if item is None or item.data(Qt.ItemDataRole.UserRole) != piece:
+                    item = QListWidgetItem()
+                    item.setData(Qt.ItemDataRole.UserRole, piece)
+                    self._piece_list.insertItem(row, item)
+
+                widget = self._piece_list.itemWidget(item)
+                if isinstance(widget, PieceListItemWidget):
+                    widget.update_count(count)
+                else:
+                    widget = PieceListItemWidget(piece, count)
+                    widget.increment_requested.connect(self._on_piece_increment)
+                    widget.decrement_requested.connect(self._on_piece_decrement)
+                    self._piece_list.setItemWidget(item, widget)
+
+            # Trim rows left over from a list that was not in sorted order
+            while self._piece_list.count() > len(sorted_pieces):
+                self._piece_list.takeItem(self._piece_list.count() - 1)
+        finally:
+            self._piece_list.setUpdatesEnabled(True)
+
+    @Slot(PuzzlePiece)
     def _on_piece_increment(self, piece: PuzzlePiece) -> None:
         """Handle increment button click for a piece."""
         if piece in self._pieces:
             self._pieces[piece] += 1
-            self._refresh_piece_list()
-            # Re-select the piece
+            self._update_piece_count_widget(piece)
             self._select_piece_in_list(piece)
-            self._piece_count_label.setText(f"Pieces: {len(self._get_all_pieces())}")
+            self._update_piece_count_label()
 
+    @Slot(PuzzlePiece)
     def _on_piece_decrement(self, piece: PuzzlePiece) -> None:
         """Handle decrement button click for a piece."""
         if piece not in self._pieces:
@@ -751,30 +893,62 @@ class PieceTab(QWidget):
 
         if self._pieces[piece] > 1:
             self._pieces[piece] -= 1
-            self._refresh_piece_list()
-            # Re-select the piece
+            self._update_piece_count_widget(piece)
             self._select_piece_in_list(piece)
         else:
             # Remove entirely when count reaches 0
             del self._pieces[piece]
             self._selected_piece = None
             self._grid_widget.clear()
+            self._remove_piece_row(piece)
+
+        self._update_piece_count_label()
+
+    def _update_piece_count_label(self) -> None:
+        """Show the total number of pieces, counting every copy."""
+        self._piece_count_label.setText(f"Pieces: {sum(self._pieces.values())}")
+
+    def _update_piece_count_widget(self, piece: PuzzlePiece) -> None:
+        """Show a piece's new count in its existing list row.
+
+        Falls back to rebuilding the list if the row has no item widget.
+
+        Args:
+            piece: The piece whose count changed
+        """
+        row = self._piece_rows.get(piece)
+        item = self._piece_list.item(row) if row is not None else None
+        widget = self._piece_list.itemWidget(item) if item is not None else None
+        if isinstance(widget, PieceListItemWidget):
+            widget.update_count(self._pieces[piece])
+        else:
             self._refresh_piece_list()
 
-        self._piece_count_label.setText(f"Pieces: {len(self._get_all_pieces())}")
+    def _remove_piece_row(self, piece: PuzzlePiece) -> None:
+        """Remove a piece's list row and shift the rows below it up.
+
+        Like _refresh_piece_list(), this leaves no current or selected row.
+
+        Args:
+            piece: The piece that was removed from the pieces dict
+        """
+        self._piece_list.setCurrentRow(-1)
+        row = self._piece_rows.pop(piece, None)
+        if row is None:
+            return
+
+        self._piece_list.takeItem(row)
+        for other, other_row in self._piece_rows.items():
+            if other_row > row:
+                self._piece_rows[other] = other_row - 1
 
     def _select_piece_in_list(self, piece: PuzzlePiece) -> None:
         """Select a piece in the list widget."""
-        sorted_pieces = sorted(
-            self._pieces.keys(),
-            key=lambda p: len(p.canonical_shape),
-        )
-        try:
-            index = sorted_pieces.index(piece)
-            self._piece_list.setCurrentRow(index)
-        except ValueError:
-            pass
+        row = self._piece_rows.get(piece)
+        if row is not None:
+            self._piece_list.setCurrentRow(row)
 
+    @Slot()
     def _on_delete_piece(self) -> None:
         """Handle deleting the selected piece."""
         if self._selected_piece is None:
@@ -786,22 +960,24 @@ class PieceTab(QWidget):
         if piece_to_delete in self._pieces:
             if self._pieces[piece_to_delete] > 1:
                 self._pieces[piece_to_delete] -= 1
+                self._update_piece_count_widget(piece_to_delete)
             else:
                 # Remove entirely
                 del self._pieces[piece_to_delete]
+                self._remove_piece_row(piece_to_delete)
 
         # Clear selection and grid
         self._selected_piece = None
         self._grid_widget.clear()
+        self._piece_list.setCurrentRow(-1)
 
-        # Refresh list and update count
-        self._refresh_piece_list()
-        self._piece_count_label.setText(f"Pieces: {len(self._get_all_pieces())}")
+        self._update_piece_count_label()
 
         self.piece_deleted.emit(piece_to_delete)
         if self._piece_deleted_callback:
             self._piece_deleted_callback(piece_to_delete)
 
+    @Slot()
     def _on_clear_shape(self) -> None:
         """Handle clearing the current shape."""
         self._grid_widget.clear()
@@ -823,6 +999,7 @@ class PieceTab(QWidget):
             if self._piece_modified_callback:
                 self._piece_modified_callback(new_piece)
 
+    @Slot()
     def _on_grid_size_changed(self) -> None:
         """Handle grid size changes."""
         width = self._width_spinner.value()
@@ -831,7 +1008,7 @@ class PieceTab(QWidget):
 
     def _update_shape_info(self) -> None:
         """Update the shape information label."""
-        cell_count = len(self._grid_widget.filled_cells)
+        cell_count = self._grid_widget.filled_count
         self._shape_info_label.setText(f"Cells: {cell_count}")
 
     @property
@@ -839,6 +1016,11 @@ class PieceTab(QWidget):
         """Get the list of all pieces with counts expanded."""
         return self._get_all_pieces()
 
+    @property
+    def is_empty(self) -> bool:
+        """Check if no pieces are defined and no shape is drawn."""
+        return not self._pieces and self._grid_widget.filled_count == 0
+
     @property
     def selected_piece(self) -> PuzzlePiece | None:
         """Get the currently selected piece."""
@@ -874,24 +1056,23 @@ class PieceTab(QWidget):
         Args:
             piece: The piece to add
         """
-        # Check if this shape already exists
+        # Check if this shape already exists; only its row needs updating
         if piece in self._pieces:
             self._pieces[piece] += 1
+            self._update_piece_count_widget(piece)
         else:
+            # Insert a single row at the piece's sorted position
             self._pieces[piece] = 1
+            self._refresh_piece_list()
 
-        # Add to list with shape info
-        piece_label = self._get_piece_label(piece)
-        item = QListWidgetItem(piece_label)
-        item.setData(Qt.ItemDataRole.UserRole, piece)
-        self._piece_list.addItem(item)
-        self._piece_count_label.setText(f"Pieces: {len(self._get_all_pieces())}")
+        self._update_piece_count_label()
 
     def clear_all(self) -> None:
         """Clear all pieces and reset the UI."""
         self._pieces.clear()
         self._selected_piece = None
         self._piece_list.clear()
+        self._piece_rows.clear()
         self._grid_widget.clear()
-        self._piece_count_label.setText("Pieces: 0")
+        self._update_piece_count_label()
         self._update_shape_info()
@@ -6,16 +6,46 @@ viewing and managing saved puzzle files.
 
 from __future__ import annotations
 
+import json
+import os
 from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (QHBoxLayout, QLabel, QListWidget,
                                QListWidgetItem, QMessageBox, QPushButton,
                                QVBoxLayout, QWidget)
 
-SAVED_PUZZLES_DIR = Path.home() / ".polyomino-puzzles" / "saved"
+from src.gui.dialogs import YES_NO
+from src.gui.io_task import start_io_task
+from src.utils.paths import SAVED_PUZZLES_DIR
+
+
+def _read_summaries(filepaths: list[Path]) -> dict[Path, str]:
+    """Describe the board size and piece count of saved puzzle files.
+
+    Files that cannot be read or are not puzzle files are left out.
+
+    Args:
+        filepaths: Saved puzzle files to read
+
+    Returns:
+        Mapping of file path to a summary like "6×5, 12 pieces"
+    """
+    summaries = {}
+    for filepath in filepaths:
+        try:
+            data = json.loads(filepath.read_bytes())
+            # Same default as PuzzleConfiguration.from_dict for older files
+            piece_count = sum(piece.get("count", 1) for piece in data["pieces"])
+            summaries[filepath] = (
+                f"{data['board_width']}×{data['board_height']}, {piece_count} pieces"
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+    return summaries
 
 
 class SavedPuzzlesTab(QWidget):
@@ -31,6 +61,9 @@ class SavedPuzzlesTab(QWidget):
     puzzle_selected = Signal(Path)
     puzzle_deleted = Signal(Path)
 
+    # Header font, built on first use (QFont needs a running QApplication)
+    _header_font: QFont | None = None
+
     def __init__(
         self,
         parent: QWidget | None = None,
@@ -49,6 +82,10 @@ class SavedPuzzlesTab(QWidget):
 
         self._puzzle_selected_callback = on_puzzle_selected
         self._puzzle_deleted_callback = on_puzzle_deleted
+        # Directory mtime the list was last built from; None forces a rescan
+        self._listing_mtime: int | None = None
+        # File mtimes the row summaries were read at
+        self._file_mtimes: dict[Path, int] = {}
 
         self._setup_ui()
 
@@ -58,7 +95,11 @@ class SavedPuzzlesTab(QWidget):
         layout.setContentsMargins(20, 20, 20, 20)
 
         header_label = QLabel("Saved Puzzles")
-        header_label.setFont(QFont("", weight=QFont.Weight.Bold, pointSize=14))
+        if SavedPuzzlesTab._header_font is None:
+            SavedPuzzlesTab._header_font = QFont(
+                "", weight=QFont.Weight.Bold, pointSize=14
+            )
+        header_label.setFont(SavedPuzzlesTab._header_font)
         layout.addWidget(header_label)
 
         instructions = QLabel(
@@ -72,6 +113,11 @@ class SavedPuzzlesTab(QWidget):
         self._saved_puzzles_list.setSelectionMode(
             QListWidget.SelectionMode.SingleSelection
         )
+        # Every row is a single line of text, so one cached row height and
+        # batched layout keep large directory listings cheap to populate
+        self._saved_puzzles_list.setUniformItemSizes(True)
+        self._saved_puzzles_list.setLayoutMode(QListWidget.LayoutMode.Batched)
+        self._saved_puzzles_list.setBatchSize(32)
         self._saved_puzzles_list.itemDoubleClicked.connect(self._on_item_double_clicked)
         layout.addWidget(self._saved_puzzles_list)
 
@@ -79,7 +125,7 @@ class SavedPuzzlesTab(QWidget):
         button_layout.setSpacing(5)
 
         self._refresh_btn = QPushButton("Refresh List")
-        self._refresh_btn.clicked.connect(self.refresh)
+        self._refresh_btn.clicked.connect(self._on_refresh_clicked)
         button_layout.addWidget(self._refresh_btn)
 
         self._delete_btn = QPushButton("Delete Selected")
@@ -89,6 +135,12 @@ class SavedPuzzlesTab(QWidget):
         button_layout.addStretch()
         layout.addLayout(button_layout)
 
+    @Slot()
+    def _on_refresh_clicked(self) -> None:
+        """Handle refresh button click."""
+        self.refresh(force=True)
+
+    @Slot(QListWidgetItem)
     def _on_item_double_clicked(self, item: QListWidgetItem) -> None:
         """Handle double-click on a puzzle item."""
         filepath = item.data(Qt.ItemDataRole.UserRole)
@@ -97,6 +149,7 @@ class SavedPuzzlesTab(QWidget):
             if self._puzzle_selected_callback:
                 self._puzzle_selected_callback(Path(filepath))
 
+    @Slot()
     def _on_delete_clicked(self) -> None:
         """Handle delete button click."""
         current_item = self._saved_puzzles_list.currentItem()
@@ -116,31 +169,146 @@ class SavedPuzzlesTab(QWidget):
             self,
             "Delete Puzzle",
             f"Delete puzzle '{filepath.stem}'?\nThis action cannot be undone.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            YES_NO,
         )
 
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                Path(filepath).unlink()
-                self.puzzle_deleted.emit(Path(filepath))
-                if self._puzzle_deleted_callback:
-                    self._puzzle_deleted_callback(Path(filepath))
-                self.refresh()
-            except OSError as e:
-                QMessageBox.critical(
-                    self,
-                    "Delete Failed",
-                    f"Failed to delete puzzle:\n{e}",
-                )
-
-    def refresh(self) -> None:
-        """Refresh the list of saved puzzles."""
-        self._saved_puzzles_list.clear()
-
-        if not SAVED_PUZZLES_DIR.exists():
+        if reply != QMessageBox.StandardButton.Yes:
             return
 
-        for filepath in sorted(SAVED_PUZZLES_DIR.glob("*.json")):
-            item = QListWidgetItem(filepath.stem)
-            item.setData(Qt.ItemDataRole.UserRole, filepath)
-            self._saved_puzzles_list.addItem(item)
+        # Hide the row right away and delete the file in the background. The
+        # row stays in the list until the result arrives, so a refresh in the
+        # meantime still finds it instead of adding the file a second time
+        filepath = Path(filepath)
+        current_item.setHidden(True)
+        self._saved_puzzles_list.setCurrentRow(-1)
+        start_io_task(
+            filepath.unlink,
+            self,
+            partial(self._on_puzzle_unlinked, current_item),
+            partial(self._on_unlink_failed, current_item),
+        )
+
+    def _on_puzzle_unlinked(self, item: QListWidgetItem, _result: object) -> None:
+        """Remove the row of a deleted puzzle and announce the deletion.
+
+        Args:
+            item: The list item hidden when the delete started
+        """
+        filepath = Path(item.data(Qt.ItemDataRole.UserRole))
+        list_widget = self._saved_puzzles_list
+        row = list_widget.row(item)
+        if row >= 0:  # A refresh may already have dropped it
+            list_widget.takeItem(row)
+
+        self.puzzle_deleted.emit(filepath)
+        if self._puzzle_deleted_callback:
+            self._puzzle_deleted_callback(filepath)
+
+    def _on_unlink_failed(self, item: QListWidgetItem, error: Exception) -> None:
+        """Show the row of a puzzle that could not be deleted again.
+
+        Args:
+            item: The list item hidden when the delete started
+            error: The exception raised by the delete
+        """
+        if self._saved_puzzles_list.row(item) >= 0:
+            item.setHidden(False)
+
+        QMessageBox.critical(
+            self,
+            "Delete Failed",
+            f"Failed to delete puzzle:\n{error}",
+        )
+
+    @Slot()
+    def refresh(self, *, force: bool = False) -> None:
+        """Refresh the list of saved puzzles.
+
+        Unless forced, the directory is only rescanned when its mtime has
+        changed since the last refresh. Rows are added or removed
+        individually so unchanged entries keep their items, and summaries are
+        only re-read for files that are new or were rewritten.
+
+        Args:
+            force: Rescan the directory even if its mtime is unchanged
+        """
+        list_widget = self._saved_puzzles_list
+        try:
+            mtime = SAVED_PUZZLES_DIR.stat().st_mtime_ns
+        except FileNotFoundError:
+            list_widget.clear()
+            self._listing_mtime = None
+            self._file_mtimes = {}
+            return
+
+        if mtime == self._listing_mtime and not force:
+            return
+        self._listing_mtime = mtime
+
+        # scandir entries carry their type, so directories are skipped without
+        # an extra stat per file
+        with os.scandir(SAVED_PUZZLES_DIR) as entries:
+            file_mtimes = {
+                Path(entry.path): entry.stat().st_mtime_ns
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            }
+        filepaths = sorted(file_mtimes)
+        # New files and files rewritten since their summary was read
+        stale_filepaths = [
+            filepath
+            for filepath in filepaths
+            if self._file_mtimes.get(filepath) != file_mtimes[filepath]
+        ]
+        self._file_mtimes = file_mtimes
+
+        # Populating a long listing should cost one repaint, not one per row
+        list_widget.setUpdatesEnabled(False)
+        try:
+            # Drop rows for files that are gone; the survivors stay sorted
+            for row in reversed(range(list_widget.count())):
+                filepath = list_widget.item(row).data(Qt.ItemDataRole.UserRole)
+                if filepath not in file_mtimes:
+                    list_widget.takeItem(row)
+
+            # Insert new files at their sorted positions
+            for row, filepath in enumerate(filepaths):
+                item = list_widget.item(row)
+                if item is None or item.data(Qt.ItemDataRole.UserRole) != filepath:
+                    item = QListWidgetItem(filepath.stem)
+                    item.setData(Qt.ItemDataRole.UserRole, filepath)
+                    list_widget.insertItem(row, item)
+        finally:
+            list_widget.setUpdatesEnabled(True)
+
+        # Fill in board size and piece count for the stale rows in the background
+        if stale_filepaths:
+            start_io_task(
+                partial(_read_summaries, stale_filepaths),
+                self,
+                partial(self._on_summaries_read, set(stale_filepaths)),
+                lambda _error: None,  # _read_summaries skips unreadable files
+            )
+
+    def _on_summaries_read(
+        self, filepaths: set[Path], summaries: dict[Path, str]
+    ) -> None:
+        """Show puzzle summaries next to the names of their rows.
+
+        Args:
+            filepaths: Files whose summaries were read
+            summaries: Mapping of file path to summary text, for the files
+                that could be read
+        """
+        list_widget = self._saved_puzzles_list
+        list_widget.setUpdatesEnabled(False)
+        try:
+            for row in range(list_widget.count()):
+                item = list_widget.item(row)
+                filepath = item.data(Qt.ItemDataRole.UserRole)
+                if filepath in summaries:
+                    item.setText(f"{filepath.stem}  ({summaries[filepath]})")
+                elif filepath in filepaths:
+                    item.setText(filepath.stem)
+        finally:
+            list_widget.setUpdatesEnabled(True)
@@ -57,11 +57,11 @@ class VisualizationWindow(QMainWindow):
         )
         board_layout = QVBoxLayout(board_frame)
 
-        # Create board widget
-        board = self._config.get_board()
+        # Create board widget; the GameBoard itself is only built once
+        # solving starts
         self._board_widget = BoardWidget(
-            width=board.width,
-            height=board.height,
+            width=self._config.board_width,
+            height=self._config.board_height,
             cell_size=30,
         )
         board_layout.addWidget(self._board_widget, 0, Qt.AlignmentFlag.AlignCenter)
@@ -208,8 +208,6 @@ class VisualizationWindow(QMainWindow):
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         """Handle window resize to adapt board cell size."""
-        board = self._config.get_board()
-
         # Account for margins (10px each side) and control panel (~60px) and status label (~25px)
         margin = 20
         controls_height = 85  # ~60 for controls, ~25 for status label
@@ -217,8 +215,8 @@ class VisualizationWindow(QMainWindow):
         available_height = event.size().height() - margin - controls_height
 
         # Calculate max cell size that fits
-        max_cell_width = available_width // board.width
-        max_cell_height = available_height // board.height
+        max_cell_width = available_width // self._config.board_width
+        max_cell_height = available_height // self._config.board_height
         cell_size = min(max_cell_width, max_cell_height)
 
         # Ensure minimum size
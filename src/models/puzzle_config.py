@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 
@@ -29,7 +30,7 @@ class PuzzleConfiguration:
         board_width: int,
         board_height: int,
         pieces: dict[PuzzlePiece, int] | None = None,
-        blocked_cells: set[tuple[int, int]] | None = None,
+        blocked_cells: Iterable[tuple[int, int]] | None = None,
     ) -> None:
         """Initialize a puzzle configuration.
 
@@ -51,22 +52,21 @@ class PuzzleConfiguration:
             raise ValueError("Board height must be between 1 and 50")
 
         # Validate blocked cells are within bounds
-        if blocked_cells:
-            for cell in blocked_cells:
-                row, col = cell
-                if not (0 <= row < board_height and 0 <= col < board_width):
-                    raise ValueError(
-                        f"Blocked cell {cell} is out of board bounds "
-                        f"({board_width}x{board_height})"
-                    )
+        blocked = frozenset(blocked_cells) if blocked_cells else frozenset()
+        self._check_blocked_cells(blocked, board_width, board_height)
 
         self._name = name.strip()
         self._board_width = board_width
         self._board_height = board_height
-        self._blocked_cells = blocked_cells.copy() if blocked_cells else set()
+        # Immutable, so the property and copy() share it instead of copying
+        self._blocked_cells = blocked
         self._pieces = pieces.copy() if pieces else {}
         self._created_at = datetime.utcnow()
         self._modified_at = datetime.utcnow()
+        self._validation_errors: list[str] | None = None  # Cached validate()
+        # Cached get_total_piece_area(); once computed, the piece mutators
+        # adjust it in place and board edits leave it alone
+        self._piece_area: int | None = None
 
     @property
     def name(self) -> str:
@@ -79,7 +79,7 @@ class PuzzleConfiguration:
         if not value or not value.strip():
             raise ValueError("Puzzle name cannot be empty")
         self._name = value.strip()
-        self._modified_at = datetime.utcnow()
+        self._mark_modified()
 
     @property
     def board_width(self) -> int:
@@ -92,9 +92,9 @@ class PuzzleConfiguration:
         return self._board_height
 
     @property
-    def blocked_cells(self) -> set[tuple[int, int]]:
+    def blocked_cells(self) -> frozenset[tuple[int, int]]:
         """Get the set of blocked cell positions."""
-        return self._blocked_cells.copy()
+        return self._blocked_cells
 
     @property
     def pieces(self) -> dict[PuzzlePiece, int]:
@@ -111,6 +111,11 @@ class PuzzleConfiguration:
         """Get last modification timestamp."""
         return self._modified_at
 
+    def _mark_modified(self) -> None:
+        """Record a modification and drop the cached validation result."""
+        self._modified_at = datetime.utcnow()
+        self._validation_errors = None
+
     @property
     def available_area(self) -> int:
         """Get number of cells available for piece placement (excluding blocked cells)."""
@@ -128,13 +133,26 @@ class PuzzleConfiguration:
     def get_total_piece_area(self) -> int:
         """Get total area of all pieces accounting for counts.
 
+        The sum is computed once and then adjusted as pieces are added or
+        removed.
+
         Returns:
             Sum of all piece areas multiplied by their counts
         """
-        total = 0
-        for piece, count in self._pieces.items():
-            total += piece.area * count
-        return total
+        if self._piece_area is None:
+            self._piece_area = sum(
+                piece.area * count for piece, count in self._pieces.items()
+            )
+        return self._piece_area
+
+    def _adjust_piece_area(self, delta: int) -> None:
+        """Apply a change in piece area to the cached total, if computed.
+
+        Args:
+            delta: Cells added (positive) or removed (negative)
+        """
+        if self._piece_area is not None:
+            self._piece_area += delta
 
     def get_all_pieces(self) -> list[PuzzlePiece]:
         """Get list of all pieces (expanding counts).
@@ -175,17 +193,84 @@ class PuzzleConfiguration:
         if piece not in self._pieces:
             raise ValueError("Piece not found")
 
+        self._adjust_piece_area(piece.area * (count - self._pieces[piece]))
         self._pieces[piece] = count
-        self._modified_at = datetime.utcnow()
+        self._mark_modified()
 
     def clear_pieces(self) -> None:
         """Remove all pieces from the configuration."""
         self._pieces.clear()
-        self._modified_at = datetime.utcnow()
+        self._piece_area = 0
+        self._mark_modified()
+
+    def resize_board(self, board_width: int, board_height: int) -> None:
+        """Change the board dimensions in place.
+
+        Blocked cells that fall outside the new bounds are dropped.
+
+        Args:
+            board_width: New board width in cells (1-50)
+            board_height: New board height in cells (1-50)
+
+        Raises:
+            ValueError: If a dimension is out of range
+        """
+        if not (1 <= board_width <= 50):
+            raise ValueError("Board width must be between 1 and 50")
+        if not (1 <= board_height <= 50):
+            raise ValueError("Board height must be between 1 and 50")
+
+        self._board_width = board_width
+        self._board_height = board_height
+        self._blocked_cells = frozenset(
+            (row, col)
+            for row, col in self._blocked_cells
+            if row < board_height and col < board_width
+        )
+        self._mark_modified()
+
+    def set_blocked_cells(self, blocked_cells: Iterable[tuple[int, int]]) -> None:
+        """Replace the blocked cells in place.
+
+        Args:
+            blocked_cells: Cell positions to mark as blocked
+
+        Raises:
+            ValueError: If a cell is out of board bounds
+        """
+        cells = frozenset(blocked_cells)  # No copy if already a frozenset
+        self._check_blocked_cells(cells, self._board_width, self._board_height)
+        self._blocked_cells = cells
+        self._mark_modified()
+
+    @staticmethod
+    def _check_blocked_cells(
+        blocked_cells: Iterable[tuple[int, int]], board_width: int, board_height: int
+    ) -> None:
+        """Raise ValueError if any blocked cell lies outside the board."""
+        for cell in blocked_cells:
+            row, col = cell
+            if not (0 <= row < board_height and 0 <= col < board_width):
+                raise ValueError(
+                    f"Blocked cell {cell} is out of board bounds "
+                    f"({board_width}x{board_height})"
+                )
 
     def validate(self) -> list[str]:
         """Validate the configuration.
 
+        The result is cached until the configuration is next modified.
+
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        if self._validation_errors is None:
+            self._validation_errors = self._collect_validation_errors()
+        return list(self._validation_errors)
+
+    def _collect_validation_errors(self) -> list[str]:
+        """Run every configuration check.
+
         Returns:
             List of validation errors (empty if valid)
         """
@@ -238,8 +323,9 @@ class PuzzleConfiguration:
             self._pieces[piece] += count
         else:
             self._pieces[piece] = count
+        self._adjust_piece_area(piece.area * count)
 
-        self._modified_at = datetime.utcnow()
+        self._mark_modified()
 
     def remove_piece(self, piece: PuzzlePiece, count: int = 1) -> None:
         """Remove a piece from the configuration.
@@ -262,8 +348,9 @@ class PuzzleConfiguration:
         self._pieces[piece] -= count
         if self._pieces[piece] == 0:
             del self._pieces[piece]
+        self._adjust_piece_area(-piece.area * count)
 
-        self._modified_at = datetime.utcnow()
+        self._mark_modified()
 
     def get_board(self) -> GameBoard:
         """Create a GameBoard from configuration.
@@ -274,7 +361,7 @@ class PuzzleConfiguration:
         return GameBoard(
             self._board_width,
             self._board_height,
-            self._blocked_cells.copy(),
+            self._blocked_cells,
         )
 
     def get_piece_area(self) -> int:
@@ -392,7 +479,7 @@ class PuzzleConfiguration:
             board_width=self._board_width,
             board_height=self._board_height,
             pieces=pieces_copy,
-            blocked_cells=self._blocked_cells.copy(),
+            blocked_cells=self._blocked_cells,
         )
         # Preserve timestamps
         new_config._created_at = self._created_at
@@ -408,18 +495,8 @@ class PuzzleConfiguration:
             and self._board_width == other._board_width
             and self._board_height == other._board_height
             and self._blocked_cells == other._blocked_cells
-            and len(self._pieces) == len(other._pieces)
-            and all(
-                p1.canonical_shape == p2.canonical_shape and c1 == c2
-                for (p1, c1), (p2, c2) in zip(
-                    sorted(
-                        self._pieces.items(), key=lambda x: str(x[0].canonical_shape)
-                    ),
-                    sorted(
-                        other._pieces.items(), key=lambda x: str(x[0].canonical_shape)
-                    ),
-                )
-            )
+            # Pieces hash and compare by canonical shape
+            and self._pieces == other._pieces
         )
 
     def __repr__(self) -> str:
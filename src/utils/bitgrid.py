@@ -0,0 +1,86 @@
+"""Row-bitmask helpers for storing grid cell membership.
+
+A grid is stored as a list with one int per row, where bit ``col`` of
+``rows[row]`` is set when cell (row, col) is marked.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+
+def cells_to_rows(
+    cells: Iterable[tuple[int, int]], width: int, height: int
+) -> list[int]:
+    """Pack a collection of cells into row bitmasks.
+
+    Args:
+        cells: (row, col) positions to mark
+        width: Number of columns in the grid
+        height: Number of rows in the grid
+
+    Returns:
+        List of ``height`` row bitmasks (out-of-bounds cells are dropped)
+    """
+    rows = [0] * height
+    for row, col in cells:
+        if 0 <= row < height and 0 <= col < width:
+            rows[row] |= 1 << col
+    return rows
+
+
+def iter_cells(rows: list[int]) -> Iterator[tuple[int, int]]:
+    """Iterate over the marked cells of a row-bitmask grid.
+
+    Args:
+        rows: Row bitmasks
+
+    Yields:
+        (row, col) positions of set bits, in row-major order
+    """
+    for row, mask in enumerate(rows):
+        while mask:
+            low_bit = mask & -mask
+            yield (row, low_bit.bit_length() - 1)
+            mask ^= low_bit
+
+
+def rows_to_cells(rows: list[int]) -> set[tuple[int, int]]:
+    """Unpack row bitmasks into a set of cells.
+
+    Args:
+        rows: Row bitmasks
+
+    Returns:
+        Set of (row, col) positions of set bits
+    """
+    return set(iter_cells(rows))
+
+
+def resize_rows(rows: list[int], width: int, height: int) -> list[int]:
+    """Clip or extend row bitmasks to new grid dimensions.
+
+    Args:
+        rows: Row bitmasks
+        width: New number of columns
+        height: New number of rows
+
+    Returns:
+        New list of ``height`` row bitmasks with columns >= width cleared
+    """
+    col_mask = (1 << width) - 1
+    resized = [mask & col_mask for mask in rows[:height]]
+    resized.extend([0] * (height - len(resized)))
+    return resized
+
+
+def count_cells(rows: list[int]) -> int:
+    """Count the marked cells of a row-bitmask grid.
+
+    Args:
+        rows: Row bitmasks
+
+    Returns:
+        Number of set bits across all rows
+    """
+    return sum(mask.bit_count() for mask in rows)
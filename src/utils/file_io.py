@@ -3,11 +3,89 @@
 from __future__ import annotations
 
 import json
+import os
+import stat
+import uuid
+from contextlib import suppress
 from pathlib import Path
 
 from src.models.puzzle_config import PuzzleConfiguration
 
 
+def _copy_file_attributes(existing: os.stat_result, filepath: Path) -> None:
+    """Give a file the permission bits and owner of the file it replaces.
+
+    Args:
+        existing: Status of the file being replaced
+        filepath: The replacement file
+    """
+    if hasattr(os, "chown"):
+        # Unprivileged users can't hand a file to another owner
+        with suppress(PermissionError):
+            os.chown(filepath, existing.st_uid, existing.st_gid)
+    # After chown, which may clear setuid/setgid bits
+    os.chmod(filepath, stat.S_IMODE(existing.st_mode))
+
+
+def _write_json(data: dict, filepath: Path, *, pretty: bool) -> None:
+    """Write a JSON document to a file, replacing it atomically.
+
+    The document is serialized in memory and written with a single call to a
+    temporary file next to ``filepath``, which is synced and then renamed over
+    the destination. A failed write never leaves a truncated file behind, and
+    an existing file keeps its permission bits and, where allowed, its owner.
+
+    Args:
+        data: JSON-serializable document
+        filepath: Destination file path
+        pretty: Indent the document for reading; otherwise write it compactly
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    if pretty:
+        text = json.dumps(data, indent=2)
+    else:
+        text = json.dumps(data, separators=(",", ":"))
+    payload = text.encode("utf-8")
+    try:
+        existing = os.stat(filepath)
+    except FileNotFoundError:
+        existing = None
+    tmp_path = filepath.with_name(f".{filepath.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        if existing is not None:
+            _copy_file_attributes(existing, tmp_path)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_json(filepath: Path) -> dict:
+    """Read a JSON document from a file.
+
+    The file is read as bytes in one call and decoded directly, skipping the
+    text-mode wrapper.
+
+    Args:
+        filepath: Input file path
+
+    Returns:
+        The decoded document
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    return json.loads(filepath.read_bytes())
+
+
 def save_puzzle(config: PuzzleConfiguration, filepath: Path) -> None:
     """Save puzzle configuration to JSON file.
 
@@ -20,10 +98,8 @@ def save_puzzle(config: PuzzleConfiguration, filepath: Path) -> None:
     """
     try:
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        data = config.to_dict()
-
-        with filepath.open("w") as f:
-            json.dump(data, f, indent=2)
+        # Saved puzzles are only read back by the app; skip the indentation
+        _write_json(config.to_dict(), filepath, pretty=False)
 
     except OSError as e:
         raise OSError(f"Failed to save puzzle to {filepath}: {e}") from e
@@ -46,10 +122,7 @@ def load_puzzle(filepath: Path) -> PuzzleConfiguration:
         if not filepath.exists():
             raise OSError(f"File not found: {filepath}")
 
-        with filepath.open("r") as f:
-            data = json.load(f)
-
-        return PuzzleConfiguration.from_dict(data)
+        return PuzzleConfiguration.from_dict(_read_json(filepath))
 
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in file {filepath}: {e}") from e
@@ -69,10 +142,7 @@ def export_puzzle(config: PuzzleConfiguration, filepath: Path) -> None:
     """
     try:
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        data = config.to_dict()
-
-        with filepath.open("w") as f:
-            json.dump(data, f, indent=2)
+        _write_json(config.to_dict(), filepath, pretty=True)
 
     except OSError as e:
         raise OSError(f"Failed to export puzzle to {filepath}: {e}") from e
@@ -95,10 +165,7 @@ def import_puzzle(filepath: Path) -> PuzzleConfiguration:
         if not filepath.exists():
             raise OSError(f"File not found: {filepath}")
 
-        with filepath.open("r") as f:
-            data = json.load(f)
-
-        return PuzzleConfiguration.from_dict(data)
+        return PuzzleConfiguration.from_dict(_read_json(filepath))
 
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in file {filepath}: {e}") from e
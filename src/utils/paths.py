@@ -0,0 +1,7 @@
+"""Filesystem locations used by the puzzle solver application."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+SAVED_PUZZLES_DIR = Path.home() / ".polyomino-puzzles" / "saved"
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import PropertyMock, patch
+
 import pytest
 
 from src.models.piece import PuzzlePiece
@@ -204,6 +206,99 @@ class TestPuzzleConfigurationModification:
 
         assert config.pieces[piece] == 2
 
+    def test_resize_board_drops_out_of_bounds_blocked_cells(self) -> None:
+        """Test that shrinking the board keeps only in-bounds blocked cells."""
+        piece = PuzzlePiece(shape={(0, 0), (1, 0)})
+        config = PuzzleConfiguration(
+            name="Test",
+            board_width=4,
+            board_height=4,
+            pieces={piece: 1},
+            blocked_cells={(0, 0), (3, 1), (1, 3)},
+        )
+
+        config.resize_board(3, 3)
+
+        assert (config.board_width, config.board_height) == (3, 3)
+        assert config.blocked_cells == {(0, 0)}
+        assert config.pieces == {piece: 1}
+
+    def test_set_blocked_cells(self) -> None:
+        """Test replacing blocked cells, rejecting out-of-bounds cells."""
+        config = PuzzleConfiguration(name="Test", board_width=4, board_height=4)
+
+        config.set_blocked_cells(frozenset({(1, 1), (2, 3)}))
+        assert config.blocked_cells == {(1, 1), (2, 3)}
+
+        with pytest.raises(ValueError, match="out of board bounds"):
+            config.set_blocked_cells({(4, 0)})
+        assert config.blocked_cells == {(1, 1), (2, 3)}
+
+    def test_validate_result_cached_until_modified(self) -> None:
+        """Test that validate() reuses its result until the config changes."""
+        domino = PuzzlePiece(shape={(0, 0), (1, 0)})
+        config = PuzzleConfiguration(
+            name="Test", board_width=2, board_height=2, pieces={domino: 1}
+        )
+
+        with patch(
+            "src.models.puzzle_config.validate_piece_shape", return_value=[]
+        ) as validate_shape:
+            first = config.validate()
+            second = config.validate()
+
+        assert validate_shape.call_count == 1
+        assert first == second
+        assert len(first) == 1  # 2 cells of pieces for 4 cells of board
+
+        config.add_piece(domino)
+
+        assert config.validate() == []
+
+    def test_piece_area_tracks_modifications(self) -> None:
+        """Test that the cached piece area is refreshed after each change."""
+        domino = PuzzlePiece(shape={(0, 0), (1, 0)})
+        tromino = PuzzlePiece(shape={(0, 0), (1, 0), (2, 0)})
+        config = PuzzleConfiguration(
+            name="Test", board_width=4, board_height=4, pieces={domino: 2}
+        )
+        assert config.get_piece_area() == 4
+
+        config.add_piece(tromino)
+        assert config.get_piece_area() == 7
+
+        config.remove_piece(domino)
+        assert config.get_piece_area() == 5
+
+        config.clear_pieces()
+        assert config.get_piece_area() == 0
+
+    def test_board_edits_do_not_resum_piece_area(self) -> None:
+        """Test that board-only changes leave the piece-area total alone."""
+        domino = PuzzlePiece(shape={(0, 0), (1, 0)})
+        config = PuzzleConfiguration(
+            name="Test", board_width=4, board_height=4, pieces={domino: 2}
+        )
+        config.update_piece(domino, 3)
+        assert config.get_piece_area() == 6
+
+        with patch.object(PuzzlePiece, "area", new_callable=PropertyMock) as area:
+            config.resize_board(5, 5)
+            config.set_blocked_cells({(0, 0)})
+            assert config.get_piece_area() == 6
+
+        area.assert_not_called()
+
+    def test_blocked_cells_shared_not_copied(self) -> None:
+        """Test that a frozenset of blocked cells is kept and handed out as is."""
+        config = PuzzleConfiguration(name="Test", board_width=4, board_height=4)
+        cells = frozenset({(0, 0), (3, 3)})
+
+        config.set_blocked_cells(cells)
+
+        assert config.blocked_cells is cells
+        assert config.copy().blocked_cells is cells
+
 
 class TestPuzzleConfigurationSerialization:
     """Test puzzle configuration serialization."""
@@ -0,0 +1,63 @@
+"""Unit tests for row-bitmask grid helpers."""
+
+from __future__ import annotations
+
+from src.utils.bitgrid import (
+    cells_to_rows,
+    count_cells,
+    iter_cells,
+    resize_rows,
+    rows_to_cells,
+)
+
+
+class TestCellsToRows:
+    """Test cells_to_rows function."""
+
+    def test_packs_cells_into_row_bits(self) -> None:
+        """Test that each cell sets bit col of its row."""
+        rows = cells_to_rows({(0, 0), (0, 2), (1, 1)}, width=3, height=2)
+        assert rows == [0b101, 0b010]
+
+    def test_drops_out_of_bounds_cells(self) -> None:
+        """Test that cells outside the grid are ignored."""
+        rows = cells_to_rows({(0, 3), (2, 0), (-1, 0), (1, 1)}, width=3, height=2)
+        assert rows == [0, 0b010]
+
+
+class TestRowsToCells:
+    """Test rows_to_cells and iter_cells functions."""
+
+    def test_round_trip(self) -> None:
+        """Test that packing then unpacking preserves the cell set."""
+        cells = {(0, 0), (2, 4), (3, 49), (1, 17)}
+        assert rows_to_cells(cells_to_rows(cells, width=50, height=4)) == cells
+
+    def test_iter_cells_is_row_major(self) -> None:
+        """Test that cells are yielded in row-major order."""
+        assert list(iter_cells([0b110, 0b001])) == [(0, 1), (0, 2), (1, 0)]
+
+    def test_empty_grid(self) -> None:
+        """Test that an empty grid has no cells."""
+        assert rows_to_cells([0, 0, 0]) == set()
+
+
+class TestResizeRows:
+    """Test resize_rows function."""
+
+    def test_shrink_clears_out_of_bounds_cells(self) -> None:
+        """Test that shrinking drops columns and rows past the new bounds."""
+        rows = cells_to_rows({(0, 0), (0, 4), (3, 1)}, width=5, height=4)
+        assert rows_to_cells(resize_rows(rows, width=3, height=2)) == {(0, 0)}
+
+    def test_grow_adds_empty_rows(self) -> None:
+        """Test that growing pads with empty rows and keeps existing cells."""
+        assert resize_rows([0b1], width=4, height=3) == [0b1, 0, 0]
+
+
+class TestCountCells:
+    """Test count_cells function."""
+
+    def test_counts_set_bits(self) -> None:
+        """Test that every marked cell is counted once."""
+        assert count_cells([0b1011, 0, 0b1]) == 4
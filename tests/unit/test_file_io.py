@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import os
+import stat
 import tempfile
 from pathlib import Path
 
@@ -123,6 +125,45 @@ class TestSavePuzzle:
             if filepath.exists():
                 filepath.unlink()
 
+    def test_save_puzzle_failure_keeps_existing_file(self, tmp_path) -> None:
+        """Test that a failed save leaves the previous file and no temp files."""
+        from unittest.mock import patch
+
+        from src.utils.file_io import save_puzzle
+
+        config = PuzzleConfiguration(
+            name="Atomic Puzzle",
+            board_width=2,
+            board_height=2,
+            pieces={PuzzlePiece(shape={(0, 0)}): 4},
+        )
+        filepath = tmp_path / "puzzle.json"
+        filepath.write_text('{"name": "previous"}')
+
+        with (
+            patch("src.utils.file_io.os.replace", side_effect=OSError("disk full")),
+            pytest.raises(OSError, match="Failed to save puzzle"),
+        ):
+            save_puzzle(config, filepath)
+
+        assert json.loads(filepath.read_text()) == {"name": "previous"}
+        assert list(tmp_path.iterdir()) == [filepath]
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_save_puzzle_keeps_existing_file_mode(self, tmp_path) -> None:
+        """Test that overwriting a save keeps the file's permission bits."""
+        from src.utils.file_io import save_puzzle
+
+        config = PuzzleConfiguration(name="Mode Puzzle", board_width=2, board_height=2)
+        filepath = tmp_path / "puzzle.json"
+        filepath.write_text("{}")
+        filepath.chmod(0o600)
+
+        save_puzzle(config, filepath)
+
+        assert stat.S_IMODE(filepath.stat().st_mode) == 0o600
+        assert json.loads(filepath.read_text())["name"] == "Mode Puzzle"
+
 
 class TestLoadPuzzle:
     """Test load_puzzle function."""
@@ -322,6 +363,20 @@ class TestExportPuzzle:
             if export_path.exists():
                 export_path.unlink()
 
+    def test_only_export_is_indented(self, tmp_path) -> None:
+        """Test that saved puzzles are compact while exports stay readable."""
+        from src.utils.file_io import export_puzzle, save_puzzle
+
+        config = PuzzleConfiguration(name="Layout Test", board_width=3, board_height=3)
+        save_path = tmp_path / "saved.json"
+        export_path = tmp_path / "exported.json"
+
+        save_puzzle(config, save_path)
+        export_puzzle(config, export_path)
+
+        assert "\n" not in save_path.read_text()
+        assert export_path.read_text().startswith('{\n  "')
+
 
 class TestImportPuzzle:
     """Test import_puzzle function."""
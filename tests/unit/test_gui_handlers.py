@@ -6,7 +6,7 @@ Tests solve button validation and QTimer management using pytest-qt.
 from __future__ import annotations
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, PropertyMock, patch
 
 
 class TestSolveButtonValidation:
@@ -74,6 +74,467 @@ class TestSolveButtonValidation:
 
             mock_msgbox.question.assert_called_once()
 
+    def test_solver_windows_closed_with_editor(self, qtbot) -> None:
+        """Test that solver windows are tracked and closed with the editor."""
+        from PySide6.QtWidgets import QMessageBox
+
+        from src.gui.editor_window import EditorWindow
+        from src.models.piece import PuzzlePiece
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        window._config.add_piece(PuzzlePiece(shape={(0, 0)}))
+
+        window._on_solve()
+        window._on_solve()
+        viz_windows = list(window._viz_windows)
+        assert len(viz_windows) == 2
+
+        with patch(
+            "src.gui.editor_window.QMessageBox.question",
+            return_value=QMessageBox.StandardButton.Yes,
+        ):
+            window.close()
+
+        assert not any(viz_window.isVisible() for viz_window in viz_windows)
+
+    def test_closed_solver_windows_pruned(self, qtbot) -> None:
+        """Test that deleted solver windows are dropped when a new one opens."""
+        from PySide6.QtCore import QCoreApplication, QEvent
+
+        from src.gui.editor_window import EditorWindow
+        from src.models.piece import PuzzlePiece
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        window._config.add_piece(PuzzlePiece(shape={(0, 0)}))
+
+        window._on_solve()
+        window._viz_windows[0].close()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        window._on_solve()
+
+        assert len(window._viz_windows) == 1
+        assert window._viz_windows[0].isVisible()
+
+
+class TestEditorWindowMenu:
+    """Tests for lazy menu bar construction."""
+
+    def test_menu_built_once_on_first_show(self, qtbot) -> None:
+        """Test that menus are created on first show and not duplicated."""
+        from src.gui.editor_window import EditorWindow
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        assert window.menuBar().actions() == []
+
+        window.show()
+        window.hide()
+        window.show()
+
+        titles = [action.text() for action in window.menuBar().actions()]
+        assert titles == ["File", "Edit", "Solve"]
+
+
+class TestBoardDimensionSync:
+    """Tests for syncing board dimensions between the tab and config."""
+
+    def test_loaded_dimensions_do_not_touch_config(self, qtbot) -> None:
+        """Test that pushing the config's own size to the tab is a no-op."""
+        from src.gui.editor_window import EditorWindow
+        from src.models.puzzle_config import PuzzleConfiguration
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        window._config = PuzzleConfiguration(
+            name="Loaded", board_width=7, board_height=3
+        )
+
+        with patch.object(window._config, "resize_board") as resize_board:
+            window._update_board()
+
+        resize_board.assert_not_called()
+        assert window._board_tab.board_width == 7
+        assert window._board_tab.board_height == 3
+
+    def test_user_resize_updates_config(self, qtbot) -> None:
+        """Test that changing the spinners resizes the config."""
+        from src.gui.editor_window import EditorWindow
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+
+        window._board_tab._width_spinner.setValue(9)
+
+        assert window.config.board_width == 9
+
+
+class TestEditorWindowStartup:
+    """Tests for work deferred out of EditorWindow construction."""
+
+    def test_saved_puzzles_listed_after_construction(self, qtbot) -> None:
+        """Test that the saved puzzle listing runs on the next event loop pass."""
+        from src.gui.editor_window import EditorWindow
+        from src.gui.saved_puzzles_tab import SavedPuzzlesTab
+
+        with patch.object(SavedPuzzlesTab, "refresh") as refresh:
+            window = EditorWindow()
+            qtbot.addWidget(window)
+            refresh.assert_not_called()
+
+            qtbot.waitUntil(lambda: refresh.call_count == 1)
+
+    def test_saved_puzzles_listing_dropped_with_editor(self, qtbot) -> None:
+        """Test that the deferred listing is skipped once its tab is deleted."""
+        from PySide6.QtCore import QCoreApplication, QEvent
+
+        from src.gui.editor_window import EditorWindow
+        from src.gui.saved_puzzles_tab import SavedPuzzlesTab
+
+        with patch.object(SavedPuzzlesTab, "refresh") as refresh:
+            window = EditorWindow()
+            qtbot.addWidget(window)
+            window._saved_puzzles_tab.deleteLater()
+            QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+            qtbot.wait(20)
+
+        refresh.assert_not_called()
+
+
+class TestValidationLabel:
+    """Tests for the editor's validation status label."""
+
+    def test_unchanged_status_skips_label_update(self, qtbot) -> None:
+        """Test that an unchanged status does not restyle the label."""
+        from src.gui.editor_window import EditorWindow
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        window._update_validation()
+        assert window._validation_label.text() == "No pieces defined"
+
+        with patch.object(window._validation_label, "setStyleSheet") as restyle:
+            window._update_validation()
+
+        restyle.assert_not_called()
+
+    def test_same_status_new_areas_keeps_style(self, qtbot) -> None:
+        """Test that new areas update the text without restyling the label."""
+        from src.gui.editor_window import EditorWindow
+        from src.models.piece import PuzzlePiece
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        window._on_piece_added(PuzzlePiece(shape={(0, 0)}))
+        assert window._validation_label.text() == (
+            "Note: Piece area (1) is less than board area (25)"
+        )
+
+        with patch.object(window._validation_label, "setStyleSheet") as restyle:
+            window._on_piece_added(PuzzlePiece(shape={(0, 0), (0, 1)}))
+
+        restyle.assert_not_called()
+        assert window._validation_label.text() == (
+            "Note: Piece area (3) is less than board area (25)"
+        )
+
+    def test_board_edits_validate_once_after_burst(self, qtbot) -> None:
+        """Test that a burst of dimension changes is validated once."""
+        from src.gui.editor_window import EditorWindow
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+
+        for width in (6, 7, 8):
+            window._board_tab._width_spinner.setValue(width)
+        assert window._validation_label.text() == ""
+
+        qtbot.waitUntil(lambda: window._validation_label.text() != "")
+        assert window._validation_label.text() == "No pieces defined"
+        assert window.config.board_width == 8
+
+
+class TestInfoDialog:
+    """Tests for the editor's shared information dialog."""
+
+    def test_info_dialog_reused(self, qtbot) -> None:
+        """Test that successive info messages reuse one QMessageBox."""
+        from PySide6.QtWidgets import QMessageBox
+
+        from src.gui.editor_window import EditorWindow
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+
+        with patch.object(QMessageBox, "exec") as exec_dialog:
+            window._show_info("Save Successful", "first")
+            box = window._info_box
+            window._show_info("Load Successful", "second")
+
+        assert exec_dialog.call_count == 2
+        assert window._info_box is box
+        assert box.windowTitle() == "Load Successful"
+        assert box.text() == "second"
+
+
+class TestFileOperations:
+    """Tests for the editor's background save and load."""
+
+    def test_save_runs_in_background(self, qtbot, tmp_path) -> None:
+        """Test that saving writes the file and reports success on completion."""
+        from src.gui.editor_window import EditorWindow
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        filepath = tmp_path / "puzzle.json"
+
+        with (
+            patch.object(window, "_choose_file", return_value=filepath),
+            patch.object(window, "_show_info") as show_info,
+            patch.object(window._saved_puzzles_tab, "refresh") as refresh,
+        ):
+            window._on_save()
+            qtbot.waitUntil(lambda: show_info.called)
+
+        assert filepath.exists()
+        assert show_info.call_args.args[0] == "Save Successful"
+        refresh.assert_called_once_with(force=True)
+
+    def test_import_dialog_opens_in_last_export_dir(self, qtbot, tmp_path) -> None:
+        """Test that import starts in the directory of the last export."""
+        from src.gui.editor_window import EditorWindow
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        export_path = tmp_path / "shared.json"
+
+        with (
+            patch.object(window, "_choose_file", return_value=export_path),
+            patch.object(window, "_run_io"),
+        ):
+            window._on_export()
+        with patch.object(window, "_choose_file", return_value=None) as choose:
+            window._on_import()
+
+        assert choose.call_args.args[1] == tmp_path
+
+    def test_file_dialog_reused(self, qtbot, tmp_path) -> None:
+        """Test that a dialog is built once and the save suffix is enforced."""
+        from PySide6.QtWidgets import QFileDialog
+
+        from src.gui.editor_window import EditorWindow
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+
+        with (
+            patch.object(QFileDialog, "exec", return_value=1),
+            patch.object(
+                QFileDialog, "selectedFiles", return_value=[str(tmp_path / "a.txt")]
+            ),
+        ):
+            first = window._choose_file("Export Puzzle", tmp_path, save=True)
+            dialog = window._file_dialogs["Export Puzzle"]
+            second = window._choose_file("Export Puzzle", tmp_path, save=True)
+
+        assert first == second == tmp_path / "a.json"
+        assert window._file_dialogs["Export Puzzle"] is dialog
+        assert dialog.acceptMode() == QFileDialog.AcceptMode.AcceptSave
+
+    def test_load_failure_reported(self, qtbot, tmp_path) -> None:
+        """Test that an unreadable file reports an error and keeps the config."""
+        from src.gui.editor_window import EditorWindow
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        config = window.config
+        filepath = tmp_path / "broken.json"
+        filepath.write_text("{not json")
+
+        with patch("src.gui.editor_window.QMessageBox.critical") as critical:
+            window._load_puzzle_from_file(filepath)
+            qtbot.waitUntil(lambda: critical.called)
+
+        assert critical.call_args.args[1] == "Load Failed"
+        assert "Invalid puzzle file" in critical.call_args.args[2]
+        assert window.config is config
+
+    def test_reloading_current_puzzle_skips_rebuild(self, qtbot, tmp_path) -> None:
+        """Test that loading a file identical to the open puzzle redraws nothing."""
+        from src.gui.editor_window import EditorWindow
+        from src.utils.file_io import save_puzzle
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        config = window.config
+        filepath = tmp_path / "current.json"
+        save_puzzle(config, filepath)
+
+        with (
+            patch.object(window, "_show_info") as show_info,
+            patch.object(window, "_update_board") as update_board,
+        ):
+            window._load_puzzle_from_file(filepath)
+            qtbot.waitUntil(lambda: show_info.called)
+
+        update_board.assert_not_called()
+        assert window.config is config
+
+
+class TestDeferredTabUpdates:
+    """Tests for refreshing hidden tabs only once they are shown."""
+
+    def test_hidden_board_updated_when_shown(self, qtbot) -> None:
+        """Test that a loaded board is pushed to the Board tab on first view."""
+        from pathlib import Path
+
+        from src.gui.editor_window import EditorWindow
+        from src.models.puzzle_config import PuzzleConfiguration
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        window._tab_widget.setCurrentWidget(window._saved_puzzles_tab)
+
+        loaded = PuzzleConfiguration(name="Wide", board_width=7, board_height=3)
+
+        with (
+            patch.object(
+                window, "_update_board", wraps=window._update_board
+            ) as update_board,
+            patch.object(window, "_show_info"),
+        ):
+            window._on_load_finished(Path("wide.json"), loaded)
+            update_board.assert_not_called()
+
+            window._tab_widget.setCurrentWidget(window._board_tab)
+            window._tab_widget.setCurrentWidget(window._piece_tab)
+            window._tab_widget.setCurrentWidget(window._board_tab)
+
+        update_board.assert_called_once()
+        assert window._board_tab.board_width == 7
+        assert window._board_tab.board_height == 3
+
+
+class TestPieceSync:
+    """Tests for mirroring piece tab edits into the configuration."""
+
+    def test_deleted_piece_removed_without_copying_pieces(self, qtbot) -> None:
+        """Test that deleting a piece skips the pieces property copy."""
+        from src.gui.editor_window import EditorWindow
+        from src.models.piece import PuzzlePiece
+        from src.models.puzzle_config import PuzzleConfiguration
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        domino = PuzzlePiece(shape={(0, 0), (0, 1)})
+        window.config.add_piece(domino, 2)
+
+        with patch.object(
+            PuzzleConfiguration, "pieces", new_callable=PropertyMock
+        ) as pieces:
+            window._on_piece_deleted(domino)
+            window._on_piece_deleted(PuzzlePiece(shape={(0, 0)}))
+
+        pieces.assert_not_called()
+        assert window.config.get_total_piece_area() == 2
+
+
+class TestNewPuzzle:
+    """Tests for the New Puzzle action."""
+
+    def test_new_puzzle_skipped_when_already_empty(self, qtbot) -> None:
+        """Test that an untouched puzzle is not rebuilt or confirmed."""
+        from src.gui.editor_window import EditorWindow
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        config = window.config
+
+        with patch("src.gui.editor_window.QMessageBox") as mock_msgbox:
+            window._on_new_puzzle()
+
+        mock_msgbox.question.assert_not_called()
+        assert window.config is config
+
+
+class TestClearAll:
+    """Tests for the Clear All action."""
+
+    def test_clear_resets_config_in_place(self, qtbot) -> None:
+        """Test that Clear All empties pieces and blocked cells, keeping size."""
+        from PySide6.QtWidgets import QMessageBox
+
+        from src.gui.editor_window import EditorWindow
+        from src.models.piece import PuzzlePiece
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        config = window.config
+        window._board_tab.set_dimensions(6, 4)
+        config.add_piece(PuzzlePiece(shape={(0, 0), (0, 1)}))
+        config.set_blocked_cells({(1, 1)})
+
+        with patch(
+            "src.gui.editor_window.QMessageBox.question",
+            return_value=QMessageBox.StandardButton.Yes,
+        ):
+            window._on_clear()
+
+        assert window.config is config
+        assert config.is_empty
+        assert config.blocked_cells == set()
+        assert (config.board_width, config.board_height) == (6, 4)
+        window._tab_widget.setCurrentWidget(window._board_tab)
+        assert window._board_tab.blocked_cells == frozenset()
+
+    def test_clear_skips_empty_piece_tab(self, qtbot) -> None:
+        """Test that Clear All leaves an already empty piece tab untouched."""
+        from PySide6.QtWidgets import QMessageBox
+
+        from src.gui.editor_window import EditorWindow
+        from src.models.piece import PuzzlePiece
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        assert window._piece_tab.is_empty
+
+        with (
+            patch(
+                "src.gui.editor_window.QMessageBox.question",
+                return_value=QMessageBox.StandardButton.Yes,
+            ),
+            patch.object(window._piece_tab, "clear_all") as clear_all,
+        ):
+            window._on_clear()
+            clear_all.assert_not_called()
+
+            window._piece_tab.add_piece(PuzzlePiece(shape={(0, 0)}))
+            window._on_clear()
+            clear_all.assert_called_once()
+
+    def test_clear_resets_drawn_shape(self, qtbot) -> None:
+        """Test that Clear All erases a shape drawn but never added."""
+        from PySide6.QtWidgets import QMessageBox
+
+        from src.gui.editor_window import EditorWindow
+
+        window = EditorWindow()
+        qtbot.addWidget(window)
+        window._tab_widget.setCurrentWidget(window._piece_tab)
+        window._piece_tab._grid_widget.filled_cells = {(0, 0), (0, 1)}
+        window._piece_tab._update_shape_info()
+
+        with patch(
+            "src.gui.editor_window.QMessageBox.question",
+            return_value=QMessageBox.StandardButton.Yes,
+        ):
+            window._on_clear()
+
+        assert window._piece_tab._grid_widget.filled_count == 0
+        assert window._piece_tab._shape_info_label.text() == "Cells: 0"
+
 
 class TestVizWindowQTimer:
     """Tests for QTimer-based solver visualization."""
@@ -90,6 +551,23 @@ class TestVizWindowQTimer:
         assert hasattr(window, "_timer")
         assert window._timer is not None
 
+    def test_construction_defers_solver_setup(self, qtbot) -> None:
+        """Test that opening the window builds no board or solver yet."""
+        from src.gui.visualization_window import VisualizationWindow
+        from src.models.puzzle_config import PuzzleConfiguration
+
+        config = PuzzleConfiguration(name="test", board_width=4, board_height=2)
+
+        with patch.object(config, "get_board") as get_board:
+            window = VisualizationWindow(config)
+            qtbot.addWidget(window)
+            window.resize(400, 300)
+            window.show()
+            qtbot.waitExposed(window)
+
+        get_board.assert_not_called()
+        assert window._generator is None
+
     def test_qtimer_interval_adjustable(self, qtbot) -> None:
         """Test that QTimer interval can be adjusted for speed control."""
         from src.gui.visualization_window import VisualizationWindow
@@ -138,6 +616,36 @@ class TestVizWindowQTimer:
         assert not window._timer.isActive()
 
 
+class TestBoardWidget:
+    """Tests for BoardWidget's cached board rendering."""
+
+    def test_solver_events_repaint_only_changed_cells(self, qtbot) -> None:
+        """Test that patching the cached pixmap matches a full redraw."""
+        from src.gui.board_widget import BoardWidget
+        from src.logic.solver import solve_backtracking
+        from src.models.board import GameBoard
+        from src.models.piece import PuzzlePiece
+
+        # Three L-trominoes cannot tile 3×3, so the solver has to backtrack
+        board = GameBoard(3, 3)
+        pieces = {PuzzlePiece(shape={(0, 0), (0, 1), (1, 0)}): 3}
+        widget = BoardWidget(3, 3)
+        qtbot.addWidget(widget)
+
+        event_types = set()
+        for event in solve_backtracking(pieces, board):
+            cached = widget._board_pixmap
+            widget.handle_event(event)
+            event_types.add(event["type"])
+            if cached is not None and event["type"] in ("place", "remove"):
+                assert widget._board_pixmap is cached
+            if widget._board_pixmap is None:
+                widget._board_pixmap = widget._render_board()
+            assert widget._board_pixmap.toImage() == widget._render_board().toImage()
+
+        assert {"place", "remove"} <= event_types
+
+
 class TestSpeedControl:
     """Tests for visualization speed control."""
 
@@ -201,3 +709,496 @@ class TestSolverCancellation:
         window._on_stop_clicked()
 
         assert not window._timer.isActive()
+
+
+class TestBoardGridEditing:
+    """Tests for blocked-cell editing on the board grid."""
+
+    def test_drag_emits_once_on_release(self, qtbot) -> None:
+        """Test that a drag across cells emits a single change on release."""
+        from PySide6.QtCore import QPoint, Qt
+
+        from src.gui.board_tab import BoardGridWidget
+
+        widget = BoardGridWidget()
+        qtbot.addWidget(widget)
+        widget.resize(300, 300)
+        widget.set_dimensions(5, 5)
+
+        emitted = []
+        widget.blocked_cells_changed.connect(emitted.append)
+
+        x, y = widget._grid_origin()
+        cell_size = widget._cell_size
+        qtbot.mousePress(widget, Qt.MouseButton.LeftButton, pos=QPoint(x + 1, y + 1))
+        widget._toggle_cell_at_position(QPoint(x + 2, y + 2))
+        widget._toggle_cell_at_position(QPoint(x + cell_size + 1, y + 1))
+        assert emitted == []
+
+        qtbot.mouseRelease(
+            widget, Qt.MouseButton.LeftButton, pos=QPoint(x + cell_size + 1, y + 1)
+        )
+
+        assert emitted == [{(0, 0), (0, 1)}]
+
+    def test_hit_test_matches_painted_grid_when_padded(self, qtbot) -> None:
+        """Test that clicks map to the drawn cell when label padding applies."""
+        from src.gui.board_tab import BoardGridWidget
+
+        widget = BoardGridWidget()
+        qtbot.addWidget(widget)
+        widget.resize(60, 60)
+        widget.set_dimensions(5, 5)
+
+        x, y = widget._grid_origin()
+
+        assert widget._get_cell_at_position(x, y) == (0, 0)
+        assert widget._get_cell_at_position(x - 1, y) is None
+
+    def test_unchanged_dimensions_keep_cached_grid(self, qtbot) -> None:
+        """Test that re-applying the current size does not invalidate caches."""
+        from src.gui.board_tab import BoardGridWidget
+
+        widget = BoardGridWidget()
+        qtbot.addWidget(widget)
+        widget.set_dimensions(5, 5)
+        grid_lines = widget._get_grid_lines()
+
+        widget.set_dimensions(5, 5)
+        widget.board_width = 5
+
+        assert widget._grid_lines is grid_lines
+
+    def test_setting_same_blocked_cells_keeps_cached_view(self, qtbot) -> None:
+        """Test that re-applying identical blocked cells is a no-op."""
+        from src.gui.board_tab import BoardGridWidget
+
+        widget = BoardGridWidget()
+        qtbot.addWidget(widget)
+        widget.blocked_cells = {(0, 0), (2, 1)}
+        view = widget.blocked_cells
+
+        widget.blocked_cells = [(2, 1), (0, 0)]
+
+        assert widget.blocked_cells is view
+
+    def test_set_dimensions_emits_once(self, qtbot) -> None:
+        """Test that setting both dimensions applies a single resize."""
+        from src.gui.board_tab import BoardTab
+
+        tab = BoardTab()
+        qtbot.addWidget(tab)
+        emitted: list[tuple[int, int]] = []
+        tab.dimensions_changed.connect(lambda w, h: emitted.append((w, h)))
+
+        tab.set_dimensions(8, 6)
+        tab.set_dimensions(8, 6)
+
+        assert emitted == [(8, 6)]
+        assert (tab._grid_widget.board_width, tab._grid_widget.board_height) == (8, 6)
+
+
+class TestPieceListSelection:
+    """Test mapping between piece list rows and pieces."""
+
+    def test_selecting_row_loads_its_piece(self, qtbot) -> None:
+        """Test that selecting a row loads the piece shown in that row."""
+        from src.gui.piece_tab import PieceTab
+        from src.models.piece import PuzzlePiece
+
+        tab = PieceTab()
+        qtbot.addWidget(tab)
+        tromino = PuzzlePiece(shape={(0, 0), (0, 1), (0, 2)})
+        domino = PuzzlePiece(shape={(0, 0), (0, 1)})
+        tab._pieces = {tromino: 1, domino: 2}
+        tab._refresh_piece_list()
+
+        assert tab._get_piece_index(domino) == 0
+        assert tab._get_piece_index(tromino) == 1
+
+        tab._select_piece_in_list(tromino)
+
+        assert tab._piece_list.currentRow() == 1
+        assert tab.selected_piece == tromino
+        assert tab.get_current_shape() == set(tromino.canonical_shape)
+
+    def test_add_piece_updates_existing_row(self, qtbot) -> None:
+        """Test that adding a known shape bumps its row instead of adding one."""
+        from src.gui.piece_tab import PieceTab
+        from src.models.piece import PuzzlePiece
+
+        tab = PieceTab()
+        qtbot.addWidget(tab)
+        domino = PuzzlePiece(shape={(0, 0), (0, 1)})
+        tromino = PuzzlePiece(shape={(0, 0), (0, 1), (0, 2)})
+
+        tab.add_piece(tromino)
+        tab.add_piece(domino)
+        widget = tab._piece_list.itemWidget(tab._piece_list.item(0))
+        tab.add_piece(PuzzlePiece(shape={(1, 0), (2, 0)}))
+
+        assert tab._piece_list.count() == 2
+        assert tab._piece_list.itemWidget(tab._piece_list.item(0)) is widget
+        assert widget._count_label.text() == "x2"
+        assert tab._piece_count_label.text() == "Pieces: 3"
+
+    def test_count_buttons_reuse_row_widget(self, qtbot) -> None:
+        """Test that +/- update the existing row instead of rebuilding it."""
+        from src.gui.piece_tab import PieceTab
+        from src.models.piece import PuzzlePiece
+
+        tab = PieceTab()
+        qtbot.addWidget(tab)
+        domino = PuzzlePiece(shape={(0, 0), (0, 1)})
+        tab._pieces = {domino: 1}
+        tab._refresh_piece_list()
+        widget = tab._piece_list.itemWidget(tab._piece_list.item(0))
+
+        tab._on_piece_increment(domino)
+        tab._on_piece_increment(domino)
+        tab._on_piece_decrement(domino)
+
+        assert tab._piece_list.itemWidget(tab._piece_list.item(0)) is widget
+        assert widget._count_label.text() == "x2"
+        assert tab._pieces[domino] == 2
+        assert tab._piece_count_label.text() == "Pieces: 2"
+
+    def test_rows_share_fonts_without_style_sheets(self, qtbot) -> None:
+        """Test that row labels use the shared fonts rather than style sheets."""
+        from src.gui.piece_tab import PieceListItemWidget
+        from src.models.piece import PuzzlePiece
+
+        first = PieceListItemWidget(PuzzlePiece(shape={(0, 0)}), 1)
+        second = PieceListItemWidget(PuzzlePiece(shape={(0, 0), (0, 1)}), 3)
+        qtbot.addWidget(first)
+        qtbot.addWidget(second)
+
+        for widget in (first, second):
+            assert widget._label.styleSheet() == ""
+            assert widget._count_label.styleSheet() == ""
+        assert second._label.font() == first._label.font()
+        assert second._count_label.font().bold()
+        assert second._count_label.font().pixelSize() == 14
+
+    def test_refresh_keeps_rows_of_unchanged_pieces(self, qtbot) -> None:
+        """Test that refreshing only inserts and removes changed rows."""
+        from PySide6.QtCore import Qt
+
+        from src.gui.piece_tab import PieceTab
+        from src.models.piece import PuzzlePiece
+
+        tab = PieceTab()
+        qtbot.addWidget(tab)
+        mono = PuzzlePiece(shape={(0, 0)})
+        domino = PuzzlePiece(shape={(0, 0), (0, 1)})
+        tromino = PuzzlePiece(shape={(0, 0), (0, 1), (0, 2)})
+        tab._pieces = {tromino: 1, mono: 1}
+        tab._refresh_piece_list()
+        tromino_widget = tab._piece_list.itemWidget(tab._piece_list.item(1))
+
+        tab._pieces = {tromino: 3, domino: 1}
+        tab._refresh_piece_list()
+
+        rows = [
+            tab._piece_list.item(row).data(Qt.ItemDataRole.UserRole)
+            for row in range(tab._piece_list.count())
+        ]
+        assert rows == [domino, tromino]
+        assert tab._piece_list.itemWidget(tab._piece_list.item(1)) is tromino_widget
+        assert tromino_widget._count_label.text() == "x3"
+        assert tab._get_piece_index(domino) == 0
+
+    def test_removing_piece_shifts_rows_below(self, qtbot) -> None:
+        """Test that removing a piece takes only its row out of the list."""
+        from src.gui.piece_tab import PieceTab
+        from src.models.piece import PuzzlePiece
+
+        tab = PieceTab()
+        qtbot.addWidget(tab)
+        mono = PuzzlePiece(shape={(0, 0)})
+        domino = PuzzlePiece(shape={(0, 0), (0, 1)})
+        tromino = PuzzlePiece(shape={(0, 0), (0, 1), (0, 2)})
+        tab._pieces = {mono: 1, domino: 1, tromino: 1}
+        tab._refresh_piece_list()
+        tromino_widget = tab._piece_list.itemWidget(tab._piece_list.item(2))
+
+        tab._select_piece_in_list(domino)
+        tab._on_delete_piece()
+
+        assert tab._piece_list.count() == 2
+        assert tab._get_piece_index(tromino) == 1
+        assert tab._piece_list.itemWidget(tab._piece_list.item(1)) is tromino_widget
+        assert tab._piece_list.selectedItems() == []
+        assert tab.selected_piece is None
+
+    def test_click_after_selection_reports_once(self, qtbot) -> None:
+        """Test that a click does not repeat the selection it just made."""
+        from src.gui.piece_tab import PieceTab
+        from src.models.piece import PuzzlePiece
+
+        selected: list[PuzzlePiece | None] = []
+        tab = PieceTab(on_piece_selected=selected.append)
+        qtbot.addWidget(tab)
+        domino = PuzzlePiece(shape={(0, 0), (0, 1)})
+        tab._pieces = {domino: 1}
+        tab._refresh_piece_list()
+        item = tab._piece_list.item(0)
+
+        tab._piece_list.setCurrentRow(0)
+        tab._piece_list.itemClicked.emit(item)
+        assert selected == [domino]
+
+        # Clicking the selected piece still restores an edited shape
+        tab._grid_widget.filled_cells = {(0, 0)}
+        tab._piece_list.itemClicked.emit(item)
+        assert selected == [domino, domino]
+        assert tab.get_current_shape() == set(domino.canonical_shape)
+
+
+class TestSavedPuzzlesTab:
+    """Test saved puzzle list management."""
+
+    def test_delete_removes_only_selected_row(self, qtbot, tmp_path) -> None:
+        """Test that deleting a puzzle removes its file and list row."""
+        from PySide6.QtWidgets import QMessageBox
+
+        from src.gui.saved_puzzles_tab import SavedPuzzlesTab
+
+        for name in ("alpha", "beta", "gamma"):
+            (tmp_path / f"{name}.json").write_text("{}")
+
+        with patch("src.gui.saved_puzzles_tab.SAVED_PUZZLES_DIR", tmp_path):
+            tab = SavedPuzzlesTab()
+            qtbot.addWidget(tab)
+            tab.refresh()
+
+        tab._saved_puzzles_list.setCurrentRow(1)
+        with patch(
+            "src.gui.saved_puzzles_tab.QMessageBox.question",
+            return_value=QMessageBox.StandardButton.Yes,
+        ):
+            tab._on_delete_clicked()
+
+        list_widget = tab._saved_puzzles_list
+        assert list_widget.item(1).isHidden()
+        qtbot.waitUntil(lambda: list_widget.count() == 2)
+        names = [list_widget.item(row).text() for row in range(list_widget.count())]
+        assert names == ["alpha", "gamma"]
+        assert not (tmp_path / "beta.json").exists()
+
+    def test_failed_delete_restores_row(self, qtbot, tmp_path) -> None:
+        """Test that a row comes back in place when its file can't be deleted."""
+        from pathlib import Path
+
+        from PySide6.QtWidgets import QMessageBox
+
+        from src.gui.saved_puzzles_tab import SavedPuzzlesTab
+
+        for name in ("alpha", "beta", "gamma"):
+            (tmp_path / f"{name}.json").write_text("{}")
+
+        with patch("src.gui.saved_puzzles_tab.SAVED_PUZZLES_DIR", tmp_path):
+            tab = SavedPuzzlesTab()
+            qtbot.addWidget(tab)
+            tab.refresh()
+
+        tab._saved_puzzles_list.setCurrentRow(1)
+        with (
+            patch(
+                "src.gui.saved_puzzles_tab.QMessageBox.question",
+                return_value=QMessageBox.StandardButton.Yes,
+            ),
+            patch("src.gui.saved_puzzles_tab.QMessageBox.critical") as critical,
+            patch.object(Path, "unlink", side_effect=OSError("busy")),
+        ):
+            tab._on_delete_clicked()
+            qtbot.waitUntil(lambda: critical.called)
+
+        list_widget = tab._saved_puzzles_list
+        names = [list_widget.item(row).text() for row in range(list_widget.count())]
+        assert names == ["alpha", "beta", "gamma"]
+        assert not list_widget.item(1).isHidden()
+
+    def test_refresh_during_failed_delete_keeps_one_row(
+        self, qtbot, tmp_path
+    ) -> None:
+        """Test that a refresh while a delete is pending doesn't duplicate its row."""
+        from pathlib import Path
+
+        from PySide6.QtWidgets import QMessageBox
+
+        from src.gui.saved_puzzles_tab import SavedPuzzlesTab
+
+        for name in ("alpha", "beta"):
+            (tmp_path / f"{name}.json").write_text("{}")
+
+        with patch("src.gui.saved_puzzles_tab.SAVED_PUZZLES_DIR", tmp_path):
+            tab = SavedPuzzlesTab()
+            qtbot.addWidget(tab)
+            tab.refresh()
+
+            tab._saved_puzzles_list.setCurrentRow(1)
+            with (
+                patch(
+                    "src.gui.saved_puzzles_tab.QMessageBox.question",
+                    return_value=QMessageBox.StandardButton.Yes,
+                ),
+                patch("src.gui.saved_puzzles_tab.QMessageBox.critical") as critical,
+                patch.object(Path, "unlink", side_effect=OSError("busy")),
+            ):
+                tab._on_delete_clicked()
+                tab.refresh(force=True)
+                qtbot.waitUntil(lambda: critical.called)
+
+        list_widget = tab._saved_puzzles_list
+        names = [list_widget.item(row).text() for row in range(list_widget.count())]
+        assert names == ["alpha", "beta"]
+        assert not list_widget.item(1).isHidden()
+
+    def test_refresh_skips_unchanged_directory(self, qtbot, tmp_path) -> None:
+        """Test that refresh doesn't rescan a directory whose mtime is unchanged."""
+        from src.gui.saved_puzzles_tab import SavedPuzzlesTab
+
+        (tmp_path / "alpha.json").write_text("{}")
+
+        with patch("src.gui.saved_puzzles_tab.SAVED_PUZZLES_DIR", tmp_path):
+            tab = SavedPuzzlesTab()
+            qtbot.addWidget(tab)
+            tab.refresh()
+
+            with patch("src.gui.saved_puzzles_tab.os.scandir") as scandir:
+                tab.refresh()
+
+        scandir.assert_not_called()
+        assert tab._saved_puzzles_list.count() == 1
+
+    def test_refresh_button_rescans_unchanged_directory(
+        self, qtbot, tmp_path
+    ) -> None:
+        """Test that the Refresh List button rescans even if the mtime is unchanged."""
+        import os
+
+        from src.gui.saved_puzzles_tab import SavedPuzzlesTab
+
+        (tmp_path / "alpha.json").write_text("{}")
+
+        with patch("src.gui.saved_puzzles_tab.SAVED_PUZZLES_DIR", tmp_path):
+            tab = SavedPuzzlesTab()
+            qtbot.addWidget(tab)
+            tab.refresh()
+
+            with patch(
+                "src.gui.saved_puzzles_tab.os.scandir", wraps=os.scandir
+            ) as scandir:
+                tab._refresh_btn.click()
+
+        scandir.assert_called_once()
+        assert tab._saved_puzzles_list.count() == 1
+
+    def test_refresh_inserts_new_files_in_order(self, qtbot, tmp_path) -> None:
+        """Test that new files are inserted in place without rebuilding rows."""
+        import os
+
+        from src.gui.saved_puzzles_tab import SavedPuzzlesTab
+
+        for name in ("alpha", "gamma"):
+            (tmp_path / f"{name}.json").write_text("{}")
+
+        with patch("src.gui.saved_puzzles_tab.SAVED_PUZZLES_DIR", tmp_path):
+            tab = SavedPuzzlesTab()
+            qtbot.addWidget(tab)
+            tab.refresh()
+            first_item = tab._saved_puzzles_list.item(0)
+
+            (tmp_path / "beta.json").write_text("{}")
+            (tmp_path / "gamma.json").unlink()
+            os.utime(tmp_path, ns=(0, tab._listing_mtime + 1))
+            tab.refresh()
+
+        names = [
+            tab._saved_puzzles_list.item(row).text()
+            for row in range(tab._saved_puzzles_list.count())
+        ]
+        assert names == ["alpha", "beta"]
+        assert tab._saved_puzzles_list.item(0) is first_item
+
+    def test_refresh_shows_puzzle_summaries(self, qtbot, tmp_path) -> None:
+        """Test that rows gain board size and piece count once read."""
+        from src.gui.saved_puzzles_tab import SavedPuzzlesTab
+        from src.models.piece import PuzzlePiece
+        from src.models.puzzle_config import PuzzleConfiguration
+        from src.utils.file_io import save_puzzle
+
+        config = PuzzleConfiguration(
+            name="Summary",
+            board_width=6,
+            board_height=4,
+            pieces={PuzzlePiece(shape={(0, 0), (0, 1)}): 3},
+        )
+        save_puzzle(config, tmp_path / "summary.json")
+        (tmp_path / "broken.json").write_text("{")
+
+        with patch("src.gui.saved_puzzles_tab.SAVED_PUZZLES_DIR", tmp_path):
+            tab = SavedPuzzlesTab()
+            qtbot.addWidget(tab)
+            tab.refresh()
+
+        list_widget = tab._saved_puzzles_list
+        qtbot.waitUntil(lambda: list_widget.item(1).text() != "summary")
+        assert list_widget.item(1).text() == "summary  (6×4, 3 pieces)"
+        assert list_widget.item(0).text() == "broken"
+
+    def test_refresh_rereads_overwritten_save(self, qtbot, tmp_path) -> None:
+        """Test that re-saving over a puzzle updates its row's summary."""
+        import os
+
+        from src.gui.saved_puzzles_tab import SavedPuzzlesTab
+        from src.models.piece import PuzzlePiece
+        from src.models.puzzle_config import PuzzleConfiguration
+        from src.utils.file_io import save_puzzle
+
+        filepath = tmp_path / "summary.json"
+        config = PuzzleConfiguration(
+            name="Summary",
+            board_width=6,
+            board_height=4,
+            pieces={PuzzlePiece(shape={(0, 0), (0, 1)}): 3},
+        )
+        save_puzzle(config, filepath)
+
+        with patch("src.gui.saved_puzzles_tab.SAVED_PUZZLES_DIR", tmp_path):
+            tab = SavedPuzzlesTab()
+            qtbot.addWidget(tab)
+            tab.refresh()
+            item = tab._saved_puzzles_list.item(0)
+            qtbot.waitUntil(lambda: item.text() == "summary  (6×4, 3 pieces)")
+
+            config.resize_board(5, 5)
+            save_puzzle(config, filepath)
+            # Make sure both mtimes move even on coarse filesystem clocks
+            mtime = filepath.stat().st_mtime_ns + 1
+            os.utime(filepath, ns=(mtime, mtime))
+            os.utime(tmp_path, ns=(0, tab._listing_mtime + 1))
+            tab.refresh()
+
+        assert tab._saved_puzzles_list.item(0) is item
+        qtbot.waitUntil(lambda: item.text() == "summary  (5×5, 3 pieces)")
+
+    def test_summary_defaults_missing_piece_count(self, tmp_path) -> None:
+        """Test that pieces without a count are summarized as one piece each."""
+        import json
+
+        from src.gui.saved_puzzles_tab import _read_summaries
+
+        filepath = tmp_path / "old.json"
+        filepath.write_text(
+            json.dumps(
+                {
+                    "board_width": 3,
+                    "board_height": 2,
+                    "pieces": [{"shape": [[0, 0]]}, {"shape": [[0, 0]], "count": 2}],
+                }
+            )
+        )
+
+        assert _read_summaries([filepath]) == {filepath: "3×2, 3 pieces"}